@@ -13,10 +13,77 @@ Date:
 __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.2.0"
 
+import io
 import os
-import shutil
 import re
-from EarthquakeSignal.models.earthquake_signal import EarthquakeSignal
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from EarthquakeSignal.core.signal_loader import _has_extension
+from EarthquakeSignal.models.earthquake_signal import (EarthquakeSignal, _capture_output, _init_record_worker,
+                                                       _worker_config)
+
+_RSN_RE = re.compile(r'(RSN\d+)', re.IGNORECASE)
+
+
+def _rsn_prefix(name):
+    """
+    Return the leading RSN identifier (e.g., 'RSN123') of a filename, or None.
+
+    Handles the common NGA-West2 naming without entering the regex engine.
+    """
+    if name[:3].upper() != 'RSN':
+        return None
+    i = 3
+    while i < len(name) and name[i].isdigit():
+        i += 1
+    return 'RSN' + name[3:i] if i > 3 else None
+
+
+def _process_group_worker(folder_path, group_id, filelist, config):
+    """
+    Build and process the EarthquakeSignal for one group of files.
+
+    Parameters
+    ----------
+    folder_path : str
+        Directory containing the group files.
+    group_id : str
+        Identifier (RSN or filename prefix).
+    filelist : list of str
+        List of filenames in this group.
+    config : dict
+        Configuration dictionary used to control the EarthquakeSignal instance.
+
+    Returns
+    -------
+    tuple
+        (group_id, EarthquakeSignal) for the processed group.
+    """
+    sources = []
+    for file in filelist:
+        src_path = os.path.join(folder_path, file)
+
+        # Detect if it's a 2-column signal (dt, acceleration)
+        with open(src_path, 'r') as f:
+            first_line = next((line for line in f if line.strip()), '')
+        data = np.loadtxt(src_path, ndmin=2) if len(first_line.split()) == 2 else None
+        if data is not None and data.shape[0] >= 2 and data.shape[1] == 2:
+            # Es un archivo tipo: tiempo/aceleración. Convertir a aceleración con dt.
+            dt = data[1, 0] - data[0, 0]
+            acc = data[:, 1]
+            payload = f"NPTS={len(acc)}, DT={dt:.6f}\n" + "\n".join(acc.astype(str)) + "\n"
+            sources.append((file, io.StringIO(payload)))
+        else:
+            # Leer en su lugar si ya tiene formato estándar
+            sources.append((file, src_path))
+
+    # Procesar con EarthquakeSignal
+    eq = EarthquakeSignal(folder_path, config, files=sources)
+    eq.name = group_id
+    eq.load_and_process()
+    return group_id, eq
 
 
 class EarthquakeBatchProcessor:
@@ -36,51 +103,101 @@ class EarthquakeBatchProcessor:
         self.folder_path = folder_path
         self.config = config
         self.earthquakes = {}
+        self._groups_cache = None
 
-    def process_all(self):
+    def process_all(self, max_workers=None, force=False):
         """
         Process all groups found in the input folder.
 
+        By default the groups are processed sequentially in the current process. With
+        max_workers > 1 they are analysed in parallel worker processes with summaries,
+        plots and export disabled (as in `process_records`); each worker's progress
+        messages and those outputs are then produced here, in the calling process, in
+        group order.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker processes (e.g., os.cpu_count()). Defaults to None, which
+            processes the groups sequentially in the current process.
+        force : bool
+            If True, rescan the folder even if its contents appear unchanged.
+
         Returns
         -------
         dict
             Dictionary of EarthquakeSignal instances keyed by RSN or prefix.
         """
-        grouped_files = self._group_by_identifier()
-        for group_id, filelist in grouped_files.items():
-            self._process_group(group_id, filelist)
+        grouped_files = self._group_by_identifier(force=force)
+
+        if len(grouped_files) > 1 and max_workers is not None and max_workers > 1:
+            # Los workers solo calculan; la salida (print/plot/export) se hace aquí
+            worker_config = _worker_config(self.config)
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                                     initializer=_init_record_worker) as executor:
+                futures = [
+                    executor.submit(_capture_output, _process_group_worker,
+                                    self.folder_path, group_id, filelist, worker_config)
+                    for group_id, filelist in grouped_files.items()
+                ]
+                for future in futures:
+                    (group_id, eq), log = future.result()
+                    print(log, end='')
+                    eq.config = self.config
+                    eq._produce_outputs()
+                    self.earthquakes[group_id] = eq
+        else:
+            for group_id, filelist in grouped_files.items():
+                self._process_group(group_id, filelist)
         return self.earthquakes
 
-    def _group_by_identifier(self):
+    def _group_by_identifier(self, force=False):
         """
         Groups files by RSN (e.g., RSN123) or fallback to prefix before first underscore.
 
+        The result is cached and reused while the folder modification time and the
+        configured extension are unchanged.
+
+        Parameters
+        ----------
+        force : bool
+            If True, ignore the cached grouping and rescan the folder.
+
         Returns
         -------
         dict
             Dictionary of grouped files by identifier.
         """
-        ext = self.config.get("file_extension", ".AT2").upper()
-        files = [f for f in os.listdir(self.folder_path) if f.upper().endswith(ext)]
-        groups = {}
+        ext = self.config.get("file_extension", ".AT2")
+        cache_key = (self.folder_path, ext, os.stat(self.folder_path).st_mtime_ns)
+        if not force and self._groups_cache is not None and self._groups_cache[0] == cache_key:
+            return self._groups_cache[1]
 
-        for file in files:
-            upper_file = file.upper()
-            match = re.search(r'(RSN\d+)', upper_file)
-            if match:
-                group_id = match.group(1)
-            elif "_" in file:
-                group_id = file.split("_")[0]
-            else:
-                group_id = os.path.splitext(file)[0]  # Use entire filename if no underscores
-
-            groups.setdefault(group_id, []).append(file)
+        with os.scandir(self.folder_path) as it:
+            files = [e.name for e in it if e.is_file() and _has_extension(e.name, ext)]
+        groups = defaultdict(list)
 
+        for file in files:
+            group_id = _rsn_prefix(file)
+            if group_id is None:
+                match = _RSN_RE.search(file)
+                if match:
+                    group_id = match.group(1).upper()
+                elif "_" in file:
+                    group_id = file.split("_")[0]
+                else:
+                    group_id = os.path.splitext(file)[0]  # Use entire filename if no underscores
+
+            groups[group_id].append(file)
+
+        groups = dict(groups)
+        self._groups_cache = (cache_key, groups)
         return groups
 
     def _process_group(self, group_id, filelist):
         """
-        Process a group by creating a named folder and instantiating EarthquakeSignal.
+        Process a group by instantiating EarthquakeSignal directly on its source files.
 
         Parameters
         ----------
@@ -89,39 +206,8 @@ class EarthquakeBatchProcessor:
         filelist : list of str
             List of filenames in this group.
         """
-        temp_dir = os.path.join(self.folder_path, group_id)
-        os.makedirs(temp_dir, exist_ok=True)
-
-        try:
-            for file in filelist:
-                src_path = os.path.join(self.folder_path, file)
-                dst_path = os.path.join(temp_dir, file)
-
-                # Detect if it's a 2-column signal (dt, acceleration)
-                with open(src_path, 'r') as f:
-                    lines = [line.strip() for line in f if line.strip()]
-                    if len(lines) >= 2 and len(lines[0].split()) == 2:
-                        # Es un archivo tipo: tiempo/aceleración. Convertir a aceleración con dt.
-                        time1, _ = map(float, lines[0].split())
-                        time2, _ = map(float, lines[1].split())
-                        dt = time2 - time1
-                        acc = [line.split()[1] for line in lines]
-                        with open(dst_path, 'w') as out:
-                            out.write(f"NPTS={len(acc)}, DT={dt:.6f}\n")
-                            for a in acc:
-                                out.write(f"{a}\n")
-                    else:
-                        # Copiar tal cual si ya tiene formato estándar
-                        shutil.copy(src_path, dst_path)
-
-            # Procesar con EarthquakeSignal
-            eq = EarthquakeSignal(temp_dir, self.config)
-            eq.name = group_id
-            eq.load_and_process()
-            self.earthquakes[group_id] = eq
-
-        finally:
-            shutil.rmtree(temp_dir)
+        _, eq = _process_group_worker(self.folder_path, group_id, filelist, self.config)
+        self.earthquakes[group_id] = eq
 
     def export_to_globals(self):
         """
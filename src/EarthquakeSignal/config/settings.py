@@ -2,11 +2,17 @@ config = {
     'file_extension': '.AT2',
     'apply_baseline_correction': True,
     'apply_arias_analysis': True,
+    'compute_pot_dest': True,
     'apply_fourier_analysis': True,
+    'fourier_fast_len': False,
     '_compute_newmark_spectra': True,
     'compute_rotd': True,
     'print_summary': True,
+    'use_cache': False,
+    'cache_dir': None,
     
+    'plot_downsample': True,
+    'plot_show': True,
     'plot_signals': True,
     'plot_corrected_signals': False,
     'plot_arias_signals': False,
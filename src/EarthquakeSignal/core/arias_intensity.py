@@ -19,7 +19,7 @@ class AriasIntensityAnalyzer:
     """
 
     @staticmethod
-    def compute(signal, dt):
+    def compute(signal, dt, return_pot=True):
         """
         Compute Arias intensity and significant duration (5%–95%).
 
@@ -29,6 +29,8 @@ class AriasIntensityAnalyzer:
             Acceleration signal in units of [m/s^2].
         dt : float
             Time step in seconds.
+        return_pot : bool
+            If False, skip the zero-crossing count and return None for pot_dest.
 
         Returns
         -------
@@ -41,30 +43,61 @@ class AriasIntensityAnalyzer:
         ia_total : float
             Total Arias intensity [m/s].
         pot_dest : float
-            Destructiveness potential as defined by energy over zero-crossing frequency squared.
+            Destructiveness potential as defined by energy over zero-crossing frequency squared
+            (None if return_pot is False).
+        """
+        return AriasIntensityAnalyzer.compute_batch(np.asarray(signal)[None, :], dt, return_pot)[0]
+
+    @staticmethod
+    def compute_batch(signals, dt, return_pot=True):
+        """
+        Compute Arias intensity and significant duration for several equal-length signals.
+
+        Parameters
+        ----------
+        signals : np.ndarray
+            Acceleration signals, shape (n_signals, N).
+        dt : float
+            Time step in seconds.
+        return_pot : bool
+            If False, skip the zero-crossing count and return None for pot_dest.
+
+        Returns
+        -------
+        list of tuple
+            One (IA_percent, t_start, t_end, ia_total, pot_dest) tuple per signal,
+            as returned by `compute`.
         """
         g = 9.81
-        signal=signal*9.81
-        t = np.arange(len(signal)) * dt
+        signals = np.asarray(signals) * 9.81
+        t_total = (signals.shape[1] - 1) * dt
 
-        # Arias intensity curve (non-normalized)
-        IA = (np.pi / (2 * g)) * np.cumsum(signal**2) * dt
-        ia_total = IA[-1]
+        # Arias intensity curves (non-normalized), squared and accumulated in place (float64)
+        IA = np.empty(signals.shape)
+        np.square(signals, out=IA, dtype=np.float64)
+        np.cumsum(IA, axis=1, out=IA)
+        IA *= (np.pi / (2 * g)) * dt
+        ia_total = IA[:, -1].copy()
 
         # Normalized to 100%
-        IA_percent = 100 * IA / ia_total
+        IA_percent = IA
+        IA_percent *= (100 / ia_total)[:, None]
 
-        # Significant duration (5%–95%)
-        idx5 = np.argmax(IA_percent >= 5)
-        idx95 = np.argmax(IA_percent >= 95)
-        t_start = t[idx5]
-        t_end = t[idx95]
+        # Significant duration (5%–95%); IA is non-decreasing, so the first index reaching
+        # each threshold is the count of samples below it, for all rows at once
+        t_start = np.count_nonzero(IA_percent < 5, axis=1) * dt
+        t_end = np.count_nonzero(IA_percent < 95, axis=1) * dt
 
-        # Count zero crossings
-        cont_pd = np.count_nonzero(np.diff(np.sign(signal)))
-        freq_cross = cont_pd / t[-1] if t[-1] > 0 else 0
+        if return_pot:
+            # Count zero crossings along the time axis
+            pos = signals > 0
+            neg = signals < 0
+            cont_pd = np.count_nonzero((pos[:, :-1] ^ pos[:, 1:]) | (neg[:, :-1] ^ neg[:, 1:]), axis=1)
+            freq_cross = cont_pd / t_total if t_total > 0 else np.zeros(len(signals))
 
-        # Destructiveness potential
-        pot_dest = ia_total / (freq_cross**2) if freq_cross > 0 else 0
+            # Destructiveness potential
+            pot_dest = [ia / f**2 if f > 0 else 0 for ia, f in zip(ia_total, freq_cross)]
+        else:
+            pot_dest = [None] * len(signals)
 
-        return IA_percent, t_start, t_end, ia_total, pot_dest
+        return [(IA_percent[r], t_start[r], t_end[r], ia_total[r], pot_dest[r]) for r in range(len(signals))]
@@ -11,17 +11,51 @@ Date:
 __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.0.0"
 
+import os
+
 import numpy as np
+from scipy.fft import rfft, next_fast_len
 from scipy.signal import find_peaks
 
 
+def _gpu_module(backend=None):
+    """
+    CuPy module to run the batched FFT with, or None for the CPU (scipy.fft) path.
+
+    Parameters
+    ----------
+    backend : {None, 'cpu', 'gpu'}
+        'gpu' requires CuPy and raises ImportError without it; 'cpu' never uses it.
+        None reads the EQS_GPU environment variable at call time and uses CuPy only
+        when EQS_GPU=1 and CuPy is installed.
+
+    Returns
+    -------
+    module or None
+    """
+    if backend not in (None, 'cpu', 'gpu'):
+        raise ValueError(f"Unknown FFT backend: {backend!r} (expected 'cpu' or 'gpu')")
+    if backend == 'cpu' or (backend is None and os.environ.get('EQS_GPU') != '1'):
+        return None
+    try:
+        import cupy
+    except ImportError:
+        if backend == 'gpu':
+            raise
+        return None
+    return cupy
+
+
 class FourierAnalyzer:
     """
     Static utility class to compute the FFT spectrum and extract dominant frequency components.
     """
 
+    # Hilos de scipy.fft por transformada (-1: todos los núcleos; 1 en procesos worker)
+    workers = -1
+
     @staticmethod
-    def compute(signal: np.ndarray, dt: float, num_frequencies: int = 4):
+    def compute(signal: np.ndarray, dt: float, num_frequencies: int = 4, n_fft: int = None):
         """
         Compute the power spectrum using FFT and extract the dominant frequencies and periods.
 
@@ -33,6 +67,8 @@ class FourierAnalyzer:
             Time step in seconds.
         num_frequencies : int
             Number of dominant frequencies to extract from the spectrum.
+        n_fft : int, optional
+            FFT length; the signal is zero-padded to it (see `compute_batch`).
 
         Returns
         -------
@@ -47,27 +83,133 @@ class FourierAnalyzer:
         dom_peaks : np.ndarray
             Amplitude values of the selected dominant frequencies.
         """
-        N = len(signal)
+        return FourierAnalyzer.compute_batch(np.asarray(signal)[np.newaxis, :], dt, num_frequencies, n_fft)[0]
+
+    @staticmethod
+    def fft_length(n_samples: int, fast_len: bool = True) -> int:
+        """
+        FFT length used for signals of n_samples points.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of samples of the signal.
+        fast_len : bool
+            If True, round up to the next 5-smooth length (scipy.fft.next_fast_len), which
+            pocketfft transforms fastest and whose plan stays cached across records of the
+            same size. If False, the signal length itself is used.
+
+        Returns
+        -------
+        int
+            Number of points of the (zero-padded) FFT.
+        """
+        return next_fast_len(n_samples, real=True) if fast_len else n_samples
+
+    @staticmethod
+    def compute_batch(signals: np.ndarray, dt: float, num_frequencies: int = 4, n_fft: int = None,
+                      backend: str = None):
+        """
+        Compute the power spectra of several equal-length signals with a single FFT call.
+
+        Parameters
+        ----------
+        signals : np.ndarray
+            Acceleration signals in units of [m/s²], shape (n_signals, N).
+        dt : float
+            Time step in seconds.
+        num_frequencies : int
+            Number of dominant frequencies to extract from each spectrum.
+        n_fft : int, optional
+            FFT length (see `fft_length`). Signals are zero-padded to n_fft points, so the
+            bin spacing becomes df = 1 / (n_fft * dt) instead of 1 / (N * dt); the power is
+            still normalized by the N original samples. Defaults to N (no padding).
+        backend : {None, 'cpu', 'gpu'}, optional
+            FFT backend (see `spectrum_batch`).
+
+        Returns
+        -------
+        list of tuple
+            One (freqs, Pyy, dom_freqs, dom_periods, dom_peaks) tuple per signal,
+            as returned by `compute`.
+        """
+        freqs, Pyy = FourierAnalyzer.spectrum_batch(signals, dt, n_fft, backend=backend)
+        return [(freqs, row) + FourierAnalyzer.dominant_peaks(freqs, row, num_frequencies) for row in Pyy]
+
+    @staticmethod
+    def spectrum_batch(signals: np.ndarray, dt: float, n_fft: int = None, backend: str = None):
+        """
+        Compute only the one-sided power spectra (the FFT part of `compute_batch`).
+
+        Parameters
+        ----------
+        signals : np.ndarray
+            Acceleration signals in units of [m/s²], shape (n_signals, N).
+        dt : float
+            Time step in seconds.
+        n_fft : int, optional
+            FFT length (see `compute_batch`). Defaults to N (no padding).
+        backend : {None, 'cpu', 'gpu'}, optional
+            'gpu' transforms the block with cupy.fft.rfft and copies only the power
+            spectra back to the host; 'cpu' uses scipy.fft. None (default) selects the
+            GPU when EQS_GPU=1 and CuPy is installed, read at each call.
+
+        Returns
+        -------
+        freqs : np.ndarray
+            Frequency vector [Hz], shared by all signals.
+        Pyy : np.ndarray
+            Power spectra, shape (n_signals, len(freqs)).
+        """
+        signals = np.atleast_2d(np.asarray(signals, dtype=np.float64))  # scipy.fft keeps float32 otherwise
+        N = signals.shape[1]
+        n_fft = N if n_fft is None else max(int(n_fft), N)
         Fs = 1.0 / dt
+        df = Fs / n_fft
 
-        # Frequency axis for the one-sided FFT
-        freqs = Fs * np.arange(0, N // 2) / N
+        # One real FFT along the time axis for all rows (zero-padded to n_fft), rows split across threads
+        cp = _gpu_module(backend)
+        if cp is not None:
+            Y = cp.fft.rfft(cp.asarray(signals), n=n_fft, axis=1)[:, :n_fft // 2]
+            Pyy = cp.asnumpy((Y.real * Y.real + Y.imag * Y.imag) / N)
+        else:
+            Y = rfft(signals, n=n_fft, axis=1, workers=FourierAnalyzer.workers)[:, :n_fft // 2]
+            Pyy = (Y.real * Y.real + Y.imag * Y.imag) / N
 
-        # Compute FFT and one-sided power spectrum
-        Y = np.fft.fft(signal)
-        Pyy = np.abs(Y[:N // 2])**2 / N
+        freqs = df * np.arange(0, n_fft // 2)
 
+        return freqs, Pyy
+
+    @staticmethod
+    def dominant_peaks(freqs: np.ndarray, Pyy: np.ndarray, num_frequencies: int = 4):
+        """
+        Select the most prominent peaks of an already computed spectrum (no FFT involved).
+
+        Parameters
+        ----------
+        freqs : np.ndarray
+            Frequency vector [Hz].
+        Pyy : np.ndarray
+            Power spectrum corresponding to freqs.
+        num_frequencies : int
+            Number of dominant frequencies to extract.
+
+        Returns
+        -------
+        tuple
+            (dom_freqs, dom_periods, dom_peaks)
+        """
         # Identify spectral peaks with minimum prominence and spacing
-        peaks, properties = find_peaks(Pyy, prominence=1e-6, distance= int(len(Pyy) * 0.02))
+        peaks, properties = find_peaks(Pyy, prominence=1e-6, distance=max(1, int(len(Pyy) * 0.02)))
         peak_amplitudes = Pyy[peaks]
-        peak_freqs = freqs[peaks]
 
         # Sort and select the most prominent peaks
         sorted_indices = np.argsort(peak_amplitudes)[::-1]
         top_indices = sorted_indices[:num_frequencies]
 
-        dom_freqs = peak_freqs[top_indices]
+        # Peak frequencies follow directly from their bin indices
+        dom_freqs = freqs[peaks[top_indices]]
         dom_peaks = peak_amplitudes[top_indices]
         dom_periods = 1.0 / dom_freqs
 
-        return freqs, Pyy, dom_freqs, dom_periods, dom_peaks
+        return dom_freqs, dom_periods, dom_peaks
@@ -12,34 +12,55 @@ __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.1.0"
 
 import numpy as np
-from scipy.integrate import cumtrapz
-from numba import njit
+from numba import njit, prange, get_num_threads
 
 
 @njit
-def solve_newmark(ag, dt, zeta, Tj):
+def _newmark_coefficients(dt):
+    # Términos que dependen solo de dt (γ = 1/2, β = 1/4), comunes a todos los periodos
     gama = 1/2
     beta = 1/4
+    dtm1 = 1 / (beta * dt ** 2)
+    dtm2 = 1 / (beta * dt)
+    cf1 = gama / (beta * dt)
+    cf2 = gama / beta - 1
+    cf3 = 1 / (2 * beta) - 1
+    cf4 = dt * (gama / (2 * beta) - 1)
+    cv1 = (1 - gama) * dt
+    cv2 = gama * dt
+    return dtm1, dtm2, cf1, cf2, cf3, cf4, cv1, cv2
+
+
+_KERNEL_SIGNATURES = [
+    f'UniTuple(float64, 5)({arr}, float64, float64, UniTuple(float64, 8), {arr}, {arr}, {arr}, {arr})'
+    for arr in ('float64[::1]', 'float32[::1]')
+]
+
+
+@njit(_KERNEL_SIGNATURES, cache=True, fastmath=True, boundscheck=False)
+def _solve_newmark_inplace(ag, zeta, Tj, coef, u, v, a, at):
+    dtm1, dtm2, cf1, cf2, cf3, cf4, cv1, cv2 = coef
     w = 2 * np.pi / Tj
     m = 1.0
     k = m * w**2
     c = 2 * m * w * zeta
-    a1 = m / (beta * dt ** 2) + c * gama / (beta * dt)
-    a2 = m / (beta * dt) + c * (gama / beta - 1)
-    a3 = m * (1 / (2 * beta) - 1) + c * dt * (gama / (2 * beta) - 1)
+    a1 = m * dtm1 + c * cf1
+    a2 = m * dtm2 + c * cf2
+    a3 = m * cf3 + c * cf4
     kp = k + a1
 
-    u = np.zeros(len(ag))
-    v = np.zeros(len(ag))
-    a = np.zeros(len(ag))
-    at = np.zeros(len(ag))
+    # Solo la condición inicial debe anularse; el bucle sobrescribe el resto
+    u[0] = 0.0
+    v[0] = 0.0
+    a[0] = 0.0
+    at[0] = 0.0
 
     for i in range(len(ag) - 1):
         p_eff = -m * ag[i] + a1 * u[i] + a2 * v[i] + a3 * a[i]
         u[i + 1] = p_eff / kp
-        a[i + 1] = (u[i + 1] - u[i]) / (beta * dt ** 2) - v[i] / (beta * dt) - a[i] * (1 / (2 * beta) - 1)
+        a[i + 1] = (u[i + 1] - u[i]) * dtm1 - v[i] * dtm2 - a[i] * cf3
         at[i + 1] = a[i + 1] + ag[i]
-        v[i + 1] = v[i] + dt * ((1 - gama) * a[i] + gama * a[i + 1])
+        v[i + 1] = v[i] + cv1 * a[i] + cv2 * a[i + 1]
 
     Sd = np.max(np.abs(u))
     Sv = np.max(np.abs(v))
@@ -47,9 +68,173 @@ def solve_newmark(ag, dt, zeta, Tj):
     PSv = w * Sd
     PSa = w ** 2 * Sd
 
+    return Sd, Sv, Sa, PSv, PSa
+
+
+@njit
+def solve_newmark(ag, dt, zeta, Tj):
+    u = np.empty(len(ag), ag.dtype)
+    v = np.empty(len(ag), ag.dtype)
+    a = np.empty(len(ag), ag.dtype)
+    at = np.empty(len(ag), ag.dtype)
+
+    coef = _newmark_coefficients(dt)
+    Sd, Sv, Sa, PSv, PSa = _solve_newmark_inplace(ag, zeta, Tj, coef, u, v, a, at)
+
     return Sd, Sv, Sa, PSv, PSa, u, v, a, at
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _spectrum_all(ag, dt, zeta, T, q, nthreads):
+    n_sig, n = ag.shape
+    nT = len(T)
+    Sd = np.zeros((n_sig, nT))
+    Sv = np.zeros((n_sig, nT))
+    Sa = np.zeros((n_sig, nT))
+    PSv = np.zeros((n_sig, nT))
+    PSa = np.zeros((n_sig, nT))
+    coef = _newmark_coefficients(dt)
+
+    PGA = np.empty(n_sig)
+    for r in range(n_sig):
+        PGA[r] = np.max(np.abs(ag[r]))
+
+    # Buffers de trabajo por hilo, reutilizados entre pares (señal, periodo)
+    U = np.empty((nthreads, n), ag.dtype)
+    V = np.empty((nthreads, n), ag.dtype)
+    A = np.empty((nthreads, n), ag.dtype)
+    AT = np.empty((nthreads, n), ag.dtype)
+
+    for b in prange(nthreads):
+        for idx in range(b, n_sig * nT, nthreads):
+            r = idx // nT
+            j = idx % nT
+            if T[j] > q:
+                res = _solve_newmark_inplace(ag[r], zeta, T[j], coef, U[b], V[b], A[b], AT[b])
+                Sd[r, j] = res[0]
+                Sv[r, j] = res[1]
+                Sa[r, j] = res[2]
+                PSv[r, j] = res[3]
+                PSa[r, j] = res[4]
+            else:
+                Sa[r, j] = PGA[r]
+                PSa[r, j] = PGA[r]
+
+    return Sd, Sv, Sa, PSv, PSa
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _psa_batch(ag, zeta, T, q, coef):
+    dtm1, dtm2, cf1, cf2, cf3, cf4, cv1, cv2 = coef
+    n_sig, n = ag.shape
+    nT = len(T)
+    PSa = np.empty((n_sig, nT))
+
+    PGA = np.empty(n_sig)
+    for r in range(n_sig):
+        PGA[r] = np.max(np.abs(ag[r]))
+
+    # Cada par (señal, periodo) es un oscilador independiente; solo se guarda max|u|
+    for idx in prange(n_sig * nT):
+        r = idx // nT
+        j = idx % nT
+        if T[j] > q:
+            w = 2 * np.pi / T[j]
+            m = 1.0
+            k = m * w**2
+            c = 2 * m * w * zeta
+            a1 = m * dtm1 + c * cf1
+            a2 = m * dtm2 + c * cf2
+            a3 = m * cf3 + c * cf4
+            kp = k + a1
+
+            u_i = 0.0
+            v_i = 0.0
+            a_i = 0.0
+            Sd = 0.0
+            for i in range(n - 1):
+                p_eff = -m * ag[r, i] + a1 * u_i + a2 * v_i + a3 * a_i
+                u_n = p_eff / kp
+                a_n = (u_n - u_i) * dtm1 - v_i * dtm2 - a_i * cf3
+                v_i = v_i + cv1 * a_i + cv2 * a_n
+                u_i = u_n
+                a_i = a_n
+                if abs(u_i) > Sd:
+                    Sd = abs(u_i)
+            PSa[r, j] = w ** 2 * Sd
+        else:
+            PSa[r, j] = PGA[r]
+
+    return PSa
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _displacement_inplace(ag, zeta, Tj, coef, u):
+    dtm1, dtm2, cf1, cf2, cf3, cf4, cv1, cv2 = coef
+    w = 2 * np.pi / Tj
+    m = 1.0
+    k = m * w**2
+    c = 2 * m * w * zeta
+    a1 = m * dtm1 + c * cf1
+    a2 = m * dtm2 + c * cf2
+    a3 = m * cf3 + c * cf4
+    kp = k + a1
+
+    # Solo se guarda el desplazamiento; velocidad y aceleración van en escalares
+    u[0] = 0.0
+    v_i = 0.0
+    a_i = 0.0
+    for i in range(len(ag) - 1):
+        p_eff = -m * ag[i] + a1 * u[i] + a2 * v_i + a3 * a_i
+        u[i + 1] = p_eff / kp
+        a_n = (u[i + 1] - u[i]) * dtm1 - v_i * dtm2 - a_i * cf3
+        v_i = v_i + cv1 * a_i + cv2 * a_n
+        a_i = a_n
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _combined_psa(ag1, ag2, zeta, T, q, coef, C, nthreads):
+    n = len(ag1)
+    nT = len(T)
+    m = C.shape[0]
+    PSa = np.empty((nT, m))
+
+    # PGA de cada combinación, usado en periodos por debajo del límite de estabilidad
+    PGA = np.zeros(m)
+    for k in range(m):
+        for i in range(n):
+            val = abs(C[k, 0] * ag1[i] + C[k, 1] * ag2[i])
+            if val > PGA[k]:
+                PGA[k] = val
+
+    U1 = np.empty((nthreads, n))
+    U2 = np.empty((nthreads, n))
+
+    for b in prange(nthreads):
+        u1 = U1[b]
+        u2 = U2[b]
+        for j in range(b, nT, nthreads):
+            if T[j] > q:
+                # Sistema lineal: la respuesta a c0·ag1 + c1·ag2 es c0·u1 + c1·u2
+                _displacement_inplace(ag1, zeta, T[j], coef, u1)
+                _displacement_inplace(ag2, zeta, T[j], coef, u2)
+                w2 = (2 * np.pi / T[j]) ** 2
+                for k in range(m):
+                    c0 = C[k, 0]
+                    c1 = C[k, 1]
+                    Sd = 0.0
+                    for i in range(n):
+                        val = abs(c0 * u1[i] + c1 * u2[i])
+                        if val > Sd:
+                            Sd = val
+                    PSa[j, k] = w2 * Sd
+            else:
+                for k in range(m):
+                    PSa[j, k] = PGA[k]
+
+    return PSa
+
+
 class NewmarkSpectrumAnalyzer:
     """
     Static class to compute PSa, PSv, Sd, Sv, Sa, and the time histories u, v, a, at
@@ -57,7 +242,7 @@ class NewmarkSpectrumAnalyzer:
     """
 
     @staticmethod
-    def compute(ag, dt, zeta=0.05):
+    def compute(ag, dt, zeta=0.05, dtype=np.float64):
         """
         Compute the response spectrum using the β-Newmark method.
 
@@ -69,6 +254,10 @@ class NewmarkSpectrumAnalyzer:
             Time step [s].
         zeta : float
             Damping ratio (default is 5%).
+        dtype : np.dtype
+            Working precision of the acceleration record and time-history buffers.
+            np.float32 halves memory traffic at a small loss of accuracy
+            (default is np.float64).
 
         Returns
         -------
@@ -85,57 +274,149 @@ class NewmarkSpectrumAnalyzer:
                 'a'   : np.ndarray, Relative acceleration time history [m/s²]
                 'at'  : np.ndarray, Absolute acceleration time history [m/s²]
         """
+        return NewmarkSpectrumAnalyzer.compute_batch(np.asarray(ag)[None, :], dt, zeta, dtype)[0]
+
+    @staticmethod
+    def compute_batch(ag, dt, zeta=0.05, dtype=np.float64):
+        """
+        Compute the full response spectra of several equal-length records at once.
+
+        All (record, period) oscillators are distributed over the threads of a single
+        parallel kernel; the T ≈ 1.0 s time histories are then solved per record.
+
+        Parameters
+        ----------
+        ag : np.ndarray
+            Ground acceleration records [g], shape (n_signals, N).
+        dt : float
+            Time step [s].
+        zeta : float
+            Damping ratio (default is 5%).
+        dtype : np.dtype
+            Working precision of the acceleration records and time-history buffers
+            (default is np.float64).
+
+        Returns
+        -------
+        list of dict
+            One dictionary per record, with the same keys as returned by `compute`.
+        """
         T = np.arange(0.01, 5.01, 0.01)
-        ag = np.asarray(ag) * 9.81  # convert from g to m/s²
+        ag = np.ascontiguousarray(ag, dtype=dtype) * 9.81  # convert from g to m/s²
 
-        Sd, Sv, Sa, PSv, PSa = [], [], [], [], []
-        u_hist, v_hist, a_hist, at_hist = [], [], [], []
+        # Estabilidad mínima
+        gama = 1/2
+        beta = 1/4
+        q = dt * np.pi * np.sqrt(2) * np.sqrt(gama - 2 * beta)
+
+        # get_num_threads se consulta fuera del kernel para que numba pueda cachearlo
+        Sd, Sv, Sa, PSv, PSa = _spectrum_all(ag, dt, zeta, T, q, get_num_threads())
+
+        # Convertir a g
+        Sa = Sa / 9.81
+        PSa = PSa / 9.81
+
+        idx_hist = np.flatnonzero(np.isclose(T, 1.0, atol=0.01) & (T > q))
+        results = []
+        for r in range(len(ag)):
+            # Historia temporal para T ≈ 1.0 s (se recalcula fuera del bucle paralelo)
+            u_hist, v_hist, a_hist, at_hist = [], [], [], []
+            if idx_hist.size:
+                _, _, _, _, _, u_hist, v_hist, a_hist, at_hist = solve_newmark(ag[r], dt, zeta, T[idx_hist[-1]])
+
+            results.append({
+                'T': T,
+                'PSa': PSa[r],
+                'PSv': PSv[r],
+                'Sd': Sd[r],
+                'Sv': Sv[r],
+                'Sa': Sa[r],
+                'u': np.array(u_hist),
+                'v': np.array(v_hist),
+                'a': np.array(a_hist) / 9.81,
+                'at': np.array(at_hist) / 9.81
+            })
+        return results
+
+    @staticmethod
+    def compute_psa_batch(ag, dt, zeta=0.05):
+        """
+        Compute only the pseudo-acceleration spectrum for several records at once.
+
+        All (record, period) oscillators are integrated in a single parallel kernel
+        that keeps just the peak displacement, so no time histories are stored.
+
+        Parameters
+        ----------
+        ag : np.ndarray
+            Ground acceleration records [g], shape (n_signals, N).
+        dt : float
+            Time step [s].
+        zeta : float
+            Damping ratio (default is 5%).
+
+        Returns
+        -------
+        dict
+            Dictionary with:
+                'T'   : np.ndarray, Periods [s]
+                'PSa' : np.ndarray, Pseudo-acceleration spectra [g], shape (n_signals, n_periods)
+        """
+        T = np.arange(0.01, 5.01, 0.01)
+        ag = np.ascontiguousarray(ag, dtype=np.float64) * 9.81  # convert from g to m/s²
 
         # Estabilidad mínima
         gama = 1/2
         beta = 1/4
         q = dt * np.pi * np.sqrt(2) * np.sqrt(gama - 2 * beta)
 
-        for Tj in T:
-            if Tj > q:
-                Sd_, Sv_, Sa_, PSv_, PSa_, u, v, a, at = solve_newmark(ag, dt, zeta, Tj)
-                Sd.append(Sd_)
-                Sv.append(Sv_)
-                Sa.append(Sa_)
-                PSv.append(PSv_)
-                PSa.append(PSa_)
-
-                if np.isclose(Tj, 1.0, atol=0.01):
-                    u_hist = u
-                    v_hist = v
-                    a_hist = a
-                    at_hist = at
-            else:
-                PGA = np.max(np.abs(ag))
-                Sd.append(0)
-                Sv.append(0)
-                Sa.append(PGA)
-                PSv.append(0)
-                PSa.append(PGA)
-
-        # Convertir a arrays
-        Sd = np.array(Sd)
-        Sv = np.array(Sv)
-        Sa = np.array(Sa) / 9.81
-        PSv = np.array(PSv)
-        PSa = np.array(PSa) / 9.81
-        a_hist = np.array(a_hist) / 9.81
-        at_hist = np.array(at_hist) / 9.81
+        PSa = _psa_batch(ag, zeta, T, q, _newmark_coefficients(dt))
+
+        return {
+            'T': T,
+            'PSa': PSa / 9.81
+        }
+
+    @staticmethod
+    def compute_psa_combinations(ag1, ag2, weights, dt, zeta=0.05):
+        """
+        Compute the pseudo-acceleration spectra of linear combinations of two records.
+
+        Since the oscillator is linear, the response to c0·ag1 + c1·ag2 is c0·u1 + c1·u2.
+        Only the two displacement histories are integrated per period; each combination
+        then costs a single pass over them.
+
+        Parameters
+        ----------
+        ag1, ag2 : np.ndarray
+            Ground acceleration records [g] of equal length.
+        weights : np.ndarray
+            Combination coefficients (c0, c1), shape (n_combinations, 2).
+        dt : float
+            Time step [s].
+        zeta : float
+            Damping ratio (default is 5%).
+
+        Returns
+        -------
+        dict
+            Dictionary with:
+                'T'   : np.ndarray, Periods [s]
+                'PSa' : np.ndarray, Pseudo-acceleration spectra [g], shape (n_periods, n_combinations)
+        """
+        T = np.arange(0.01, 5.01, 0.01)
+        ag1 = np.ascontiguousarray(ag1, dtype=np.float64) * 9.81  # convert from g to m/s²
+        ag2 = np.ascontiguousarray(ag2, dtype=np.float64) * 9.81
+        weights = np.ascontiguousarray(weights, dtype=np.float64).reshape(-1, 2)
+
+        # Estabilidad mínima
+        gama = 1/2
+        beta = 1/4
+        q = dt * np.pi * np.sqrt(2) * np.sqrt(gama - 2 * beta)
+
+        PSa = _combined_psa(ag1, ag2, zeta, T, q, _newmark_coefficients(dt), weights, get_num_threads())
 
         return {
             'T': T,
-            'PSa': PSa,
-            'PSv': PSv,
-            'Sd': Sd,
-            'Sv': Sv,
-            'Sa': Sa,
-            'u': np.array(u_hist),
-            'v': np.array(v_hist),
-            'a': a_hist,
-            'at': at_hist
+            'PSa': PSa / 9.81
         }
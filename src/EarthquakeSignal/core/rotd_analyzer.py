@@ -8,7 +8,7 @@ class RotDSpectrumAnalyzer:
     """
 
     @staticmethod
-    def compute_rotd(H1, H2, dt, damping=0.05):
+    def compute_rotd(H1, H2, dt, damping=0.05, known_psa=None):
         """
         Parameters
         ----------
@@ -20,6 +20,9 @@ class RotDSpectrumAnalyzer:
             Time step of the input signals.
         damping : float
             Damping ratio (default is 5%).
+        known_psa : dict, optional
+            Already computed PSa spectra [g] keyed by rotation angle in degrees
+            (e.g., {0: PSa_H1, 90: PSa_H2}). These angles are not recomputed.
 
         Returns
         -------
@@ -27,42 +30,48 @@ class RotDSpectrumAnalyzer:
             Dictionary containing ROTD00, ROTD50, ROTD100, angles, and PSA matrix.
         """
         angles = np.arange(0, 181, 5)
-        psa_matrix = []
 
-        for angle in angles:
-            rot = np.cos(np.radians(angle)) * H1 + np.sin(np.radians(angle)) * H2
-            result = NewmarkSpectrumAnalyzer.compute(rot, dt, damping)
-            psa_matrix.append(result["PSa"])
+        # Ángulos con espectro ya conocido (0° = H1, 90° = H2, 180° = -H1) no se recalculan
+        known_psa = known_psa or {}
+        pending = np.array([a not in known_psa for a in angles])
 
-        psa_matrix = np.array(psa_matrix).T  # Shape: (n_periods, 181)
+        # Rotation θ is the combination cos(θ)·H1 + sin(θ)·H2; the arithmetic mean is 0.5·H1 + 0.5·H2
+        theta = np.deg2rad(angles[pending])
+        weights = np.vstack([np.column_stack([np.cos(theta), np.sin(theta)]), [0.5, 0.5]])
+        result = NewmarkSpectrumAnalyzer.compute_psa_combinations(H1, H2, weights, dt, damping)
+        n_pending = np.count_nonzero(pending)
 
-        rotd00 = np.percentile(psa_matrix, 0, axis=1)
-        rotd50 = np.percentile(psa_matrix, 50, axis=1)
-        rotd100 = np.percentile(psa_matrix, 100, axis=1)
-
-        idx00 = np.argmax(psa_matrix == rotd00[:, None], axis=1)
-        idx50 = np.argmax(psa_matrix == rotd50[:, None], axis=1)
-        idx100 = np.argmax(psa_matrix == rotd100[:, None], axis=1)
-
-        angle00 = angles[idx00]
-        angle50 = angles[idx50]
-        angle100 = angles[idx100]
+        # Matriz contigua (n_periods, n_angles): las reducciones por periodo recorren filas
+        psa_matrix = np.empty((len(result["T"]), len(angles)), order='C')
+        psa_matrix[:, pending] = result["PSa"][:, :n_pending]
+        for k in np.flatnonzero(~pending):
+            psa_matrix[:, k] = known_psa[angles[k]]
+        psa_arith_mean = np.ascontiguousarray(result["PSa"][:, n_pending])
 
+        # The geometric mean record is not a linear combination and is integrated on its own
         geo_mean = np.sqrt(np.abs(H1 * H2))
-        gm_result = NewmarkSpectrumAnalyzer.compute(geo_mean, dt, damping)
+        psa_geo_mean = NewmarkSpectrumAnalyzer.compute_psa_batch(geo_mean[None, :], dt, damping)["PSa"][0]
+
+        # With an odd number of angles the median is an actual matrix entry
+        mid = len(angles) // 2
+        idx = np.empty((3, psa_matrix.shape[0]), dtype=np.intp)  # rows: RotD00, RotD50, RotD100
+        np.argmin(psa_matrix, axis=1, out=idx[0])
+        idx[1] = np.argpartition(psa_matrix, mid, axis=1)[:, mid]
+        np.argmax(psa_matrix, axis=1, out=idx[2])
 
-        arith_mean = 0.5 * (H1 + H2)
-        am_result = NewmarkSpectrumAnalyzer.compute(arith_mean, dt, damping)
+        # Un bloque contiguo por magnitud (3, n_periods); cada RotD es una vista de fila
+        rotd = psa_matrix[np.arange(psa_matrix.shape[0]), idx]
+        rotd_angles = angles[idx]
 
         return {
             "T": result["T"],
-            "ROTD00": rotd00,
-            "ROTD50": rotd50,
-            "ROTD100": rotd100,
-            "angle_rotd00": angle00,
-            "angle_rotd50": angle50,
-            "angle_rotd100": angle100,
+            "ROTD00": rotd[0],
+            "ROTD50": rotd[1],
+            "ROTD100": rotd[2],
+            "angle_rotd00": rotd_angles[0],
+            "angle_rotd50": rotd_angles[1],
+            "angle_rotd100": rotd_angles[2],
             "PSa_matrix": psa_matrix,
-            "PSa_geo_mean": gm_result["PSa"],
-            "PSa_arith_mean": am_result["PSa"],
+            "PSa_geo_mean": psa_geo_mean,
+            "PSa_arith_mean": psa_arith_mean,
         }
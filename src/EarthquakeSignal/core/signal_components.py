@@ -55,10 +55,13 @@ class SignalComponentIdentifier:
         # --- Try to identify based on filename endings: _X, _Y, _Z ---
         filename_map = {'_X': 'H1', '_Y': 'H2', '_Z': 'V'}
 
-        for key in signals.keys():
-            basename = os.path.splitext(os.path.basename(key))[0]  # remove extension
+        # Nombre base (sin extensión) de cada archivo, calculado una sola vez
+        basenames = {key: os.path.splitext(os.path.basename(key))[0] for key in signals}
+
+        for key, basename in basenames.items():
+            basename_upper = basename.upper()
             for suffix, label in filename_map.items():
-                if basename.upper().endswith(suffix):
+                if basename_upper.endswith(suffix):
                     if label in identified:
                         raise ValueError(f"Duplicate component label detected for {label}")
                     identified[label] = signals[key]
@@ -67,23 +70,23 @@ class SignalComponentIdentifier:
 
         # --- Fallback to RMS-based identification if incomplete ---
         if len(identified) < 3:
+            used_names = set(names.values())
             remaining = {
                 name: signal for name, signal in signals.items()
-                if os.path.splitext(os.path.basename(name))[0] not in names.values()
+                if basenames[name] not in used_names
             }
 
-            rms_values = {
-                name: np.sqrt(np.mean(signal**2))
-                for name, signal in remaining.items()
-            }
+            # RMS of all remaining signals in a single reduction over a (n, N) stack
+            keys = list(remaining)
+            arr = np.stack([remaining[k] for k in keys])
+            rms = np.sqrt(np.einsum('ij,ij->i', arr, arr) / arr.shape[1])
 
-            sorted_rms = sorted(rms_values.items(), key=lambda x: x[1])
+            sorted_names = [keys[i] for i in np.argsort(rms, kind='stable')]
             fallback_labels = [lbl for lbl in ['V', 'H1', 'H2'] if lbl not in identified]
 
-            for (fname, _), label in zip(sorted_rms, fallback_labels):
+            for fname, label in zip(sorted_names, fallback_labels):
                 identified[label] = signals[fname]
-                basename = os.path.splitext(os.path.basename(fname))[0]
-                names[label] = basename  # <- again, without extension
+                names[label] = basenames[fname]  # <- again, without extension
 
         # --- Final validation ---
         if set(identified.keys()) != {'H1', 'H2', 'V'}:
@@ -4,7 +4,7 @@ Description:
     from a given folder path. It supports .AT2, vertical TXT, and RENAC horizontal formats.
     The loader extracts the sampling interval from DT lines or computes it from frequency metadata.
     It parses data in horizontal or vertical format, pads signals to equal length,
-    and fills malformed lines with zeros when needed.
+    and fills malformed lines with zeros when needed. Signals are stored as float32.
 
 Date:
     2025-05-10
@@ -16,6 +16,29 @@ __version__ = "1.2.1"
 import os
 import numpy as np
 import re
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# Una línea con cero o más literales numéricos separados por espacios
+_NUMERIC_LINE_RE = re.compile(r'(?:[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?(?:\s+|$))*$')
+# Valor de DT en encabezados AT2 ("DT= 0.0050 SEC")
+_DT_RE = re.compile(r'DT\s*=\s*([0-9.Ee+-]+)')
+# Primer valor en una línea vertical "DT = 0.005"
+_DT_VALUE_RE = re.compile(r'([0-9.Ee+-]+)')
+# Primer literal numérico (frecuencia de muestreo RENAC)
+_NUM_RE = re.compile(r'([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)')
+
+
+def _has_extension(name, extension):
+    """
+    Return True if the filename ends with the configured extension, ignoring case.
+
+    Shared by the loader, the cache fingerprint and the batch grouping so that all of
+    them select the same files (e.g., '.AT2' matches 'RSN1.at2', '.AT2.txt' matches
+    'RSN1.AT2.TXT').
+    """
+    return name.upper().endswith(extension.upper())
+
 
 class SignalLoader:
     """
@@ -23,7 +46,10 @@ class SignalLoader:
     the sampling interval and aligned signal arrays.
     """
 
-    def __init__(self, path, extension):
+    # Hilos máximos para leer los archivos de un registro (1 en procesos worker)
+    max_threads = 8
+
+    def __init__(self, path, extension, files=None):
         """
         Initialize the SignalLoader with the folder path and file extension.
 
@@ -33,9 +59,13 @@ class SignalLoader:
             Directory containing the signal files.
         extension : str
             Extension of the files to read (e.g., '.AT2', '.TXT').
+        files : list of tuple, optional
+            Explicit list of (filename, source) pairs, where source is a file path
+            or an open text stream. When given, the folder is not scanned.
         """
         self.path = path
         self.extension = extension.upper()
+        self.files = files
 
     def read(self):
         """
@@ -48,81 +78,154 @@ class SignalLoader:
         signals : dict
             Dictionary with filenames as keys and acceleration arrays as values.
         """
-        files = [f for f in os.listdir(self.path) if f.upper().endswith(self.extension)]
-        if not files:
+        if self.files is not None:
+            sources = list(self.files)
+        else:
+            with os.scandir(self.path) as entries:
+                sources = [(e.name, e.path) for e in entries
+                           if _has_extension(e.name, self.extension)]
+        if not sources:
             raise FileNotFoundError(f"No files with extension {self.extension} found in {self.path}")
 
         dt = None
         signals = {}
 
-        for file in files:
-            full_path = os.path.join(self.path, file)
-            with open(full_path, 'r') as f:
-                lines = f.readlines()
-
-            current_dt = None
-            data_lines = []
-            data_str = ""
-
-            # --- Caso 1: formato AT2 clásico con DT= ---
-            dt_line = next((line for line in lines if 'DT=' in line.upper()), None)
-            if dt_line:
-                match = re.search(r'DT\s*=\s*([0-9.Ee+-]+)', dt_line)
-                if not match:
-                    raise ValueError(f"Invalid DT format in file {file}")
-                current_dt = float(match.group(1))
-                idx_start = lines.index(dt_line) + 1
-                data_lines = lines[idx_start:]
-                data_str = ' '.join(self._clean_lines(data_lines))
-
-            # --- Caso 2: formato vertical con línea "DT = 0.005" ---
-            elif any("DT" in l.upper() for l in lines):
-                for i, line in enumerate(lines):
-                    if "DT" in line.upper():
-                        match = re.search(r'([0-9.Ee+-]+)', line)
-                        current_dt = float(match.group(1))
-                        idx_start = i + 1
-                        data_lines = lines[idx_start:]
-                        break
-                data_str = '\n'.join([line.strip() for line in data_lines if line.strip()])
-
-            # --- Caso 3: formato RENAC con frecuencia de muestreo ---
-            elif any("FRECUENCIA" in l.upper() and "HZ" in l.upper() for l in lines):
-                freq_line = next(line for line in lines if "FRECUENCIA" in line.upper())
-                match = re.search(r'([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)', freq_line)
-                if not match:
-                    raise ValueError(f"No numeric frequency found in line: {freq_line}")
-                frequency = float(match.group(1))
-                current_dt = 1.0 / frequency
-
-                # Buscar línea separadora para comenzar datos
-                separator_index = next(i for i, l in enumerate(lines) if set(l.strip()) == set("_"))
-                data_lines = lines[separator_index + 1:]
-                clean_lines = [line.strip() for line in data_lines if line.strip()]
-                data_str = ' '.join(clean_lines)
-
-            else:
-                raise ValueError(f"Unsupported file format in file: {file}")
+        # Leer y parsear los archivos en paralelo; el orden de salida se conserva
+        with ThreadPoolExecutor(max_workers=min(self.max_threads, len(sources))) as executor:
+            results = list(executor.map(self._parse_file, sources))
 
+        for file, current_dt, data_values in results:
             # Validar consistencia de dt
             if dt is None:
                 dt = current_dt
             elif abs(current_dt - dt) > 1e-6:
                 raise ValueError(f"Inconsistent sampling interval in file {file}: {current_dt} ≠ {dt}")
 
-            # Convertir a arreglo NumPy
-            data_values = np.fromstring(data_str, sep=' ')
             signals[file] = data_values
 
-        # Padding para igualar longitudes
+        # Padding para igualar longitudes en un único bloque (n_signals, max_len)
         max_len = max(len(sig) for sig in signals.values())
-        for fname, sig in signals.items():
+        out = np.zeros((len(signals), max_len), dtype=np.float32)
+        for i, (fname, sig) in enumerate(signals.items()):
+            out[i, :len(sig)] = sig
             if len(sig) < max_len:
-                padding = np.zeros(max_len - len(sig))
-                signals[fname] = np.concatenate([sig, padding])
                 print(f"[WARNING] Signal '{fname}' was padded with zeros to reach {max_len} samples.")
 
-        return dt, signals
+        return dt, {fname: out[i] for i, fname in enumerate(signals)}
+
+    def _parse_file(self, item):
+        """
+        Read and parse a single signal file.
+
+        Parameters
+        ----------
+        item : tuple
+            (filename, source) pair, where source is a file path or a text stream.
+
+        Returns
+        -------
+        tuple
+            (filename, dt, data_values) with the sampling interval [s] and the
+            acceleration array of the file.
+        """
+        file, source = item
+        lines = self._read_lines(source)
+
+        current_dt = None
+        data_lines = []
+        data_str = ""
+        data_values = None
+
+        # --- Caso 1: formato AT2 clásico con DT= ---
+        dt_line = next((line for line in lines if 'DT=' in line.upper()), None)
+        if dt_line:
+            match = _DT_RE.search(dt_line)
+            if not match:
+                raise ValueError(f"Invalid DT format in file {file}")
+            current_dt = float(match.group(1))
+            idx_start = lines.index(dt_line) + 1
+            data_values = self._parse_values(lines[idx_start:])
+
+        # --- Caso 2: formato vertical con línea "DT = 0.005" ---
+        elif any("DT" in l.upper() for l in lines):
+            for i, line in enumerate(lines):
+                if "DT" in line.upper():
+                    match = _DT_VALUE_RE.search(line)
+                    current_dt = float(match.group(1))
+                    idx_start = i + 1
+                    data_lines = lines[idx_start:]
+                    break
+            data_str = '\n'.join([line.strip() for line in data_lines if line.strip()])
+
+        # --- Caso 3: formato RENAC con frecuencia de muestreo ---
+        elif any("FRECUENCIA" in l.upper() and "HZ" in l.upper() for l in lines):
+            freq_line = next(line for line in lines if "FRECUENCIA" in line.upper())
+            match = _NUM_RE.search(freq_line)
+            if not match:
+                raise ValueError(f"No numeric frequency found in line: {freq_line}")
+            frequency = float(match.group(1))
+            current_dt = 1.0 / frequency
+
+            # Buscar línea separadora para comenzar datos
+            separator_index = next(i for i, l in enumerate(lines) if set(l.strip()) == set("_"))
+            data_lines = lines[separator_index + 1:]
+            clean_lines = [line.strip() for line in data_lines if line.strip()]
+            data_str = ' '.join(clean_lines)
+
+        else:
+            raise ValueError(f"Unsupported file format in file: {file}")
+
+        # Convertir a arreglo NumPy
+        if data_values is None:
+            data_values = np.fromstring(data_str, dtype=np.float32, sep=' ')
+        return file, current_dt, data_values
+
+    def _parse_values(self, data_lines):
+        """
+        Parse the numeric block following the DT line.
+
+        Well-formed data is converted directly from the joined text; only when a
+        token fails to parse are the lines cleaned one by one. NumPy 1.x does not
+        raise on such a token but warns and returns the values read so far, so the
+        warning is escalated to an error to reach the same fallback.
+
+        Parameters
+        ----------
+        data_lines : list of str
+            Raw lines after DT metadata line.
+
+        Returns
+        -------
+        np.ndarray
+            Parsed acceleration values.
+        """
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                return np.fromstring(' '.join(data_lines), dtype=np.float32, sep=' ')
+        except (ValueError, DeprecationWarning):
+            pass
+        return np.fromstring(' '.join(self._clean_lines(data_lines)), dtype=np.float32, sep=' ')
+
+    @staticmethod
+    def _read_lines(source):
+        """
+        Read all lines from a file path or an already open text stream.
+
+        Parameters
+        ----------
+        source : str or file-like
+            Path to the signal file, or a text stream (e.g., io.StringIO).
+
+        Returns
+        -------
+        list of str
+            Raw lines of the file.
+        """
+        if hasattr(source, 'readlines'):
+            return source.readlines()
+        with open(source, 'r') as f:
+            return f.readlines()
 
     def _clean_lines(self, data_lines):
         """
@@ -139,15 +242,28 @@ class SignalLoader:
             Cleaned lines containing only valid numeric data.
         """
         clean_lines = []
+        n_tokens = 0
         for line in data_lines:
-            try:
-                _ = [float(v) for v in line.strip().split()]
-                clean_lines.append(line.strip())
-            except ValueError:
-                if clean_lines:
-                    avg_len = int(np.mean([len(l.split()) for l in clean_lines]))
-                    zero_line = ' '.join(['0.0'] * avg_len)
-                    clean_lines.append(zero_line)
-                else:
-                    clean_lines.append('0.0')
+            stripped = line.strip()
+            if _NUMERIC_LINE_RE.match(stripped) or self._is_numeric(stripped):
+                clean_lines.append(stripped)
+                n_tokens += len(stripped.split())
+            elif clean_lines:
+                avg_len = int(n_tokens / len(clean_lines))
+                clean_lines.append(' '.join(['0.0'] * avg_len))
+                n_tokens += avg_len
+            else:
+                clean_lines.append('0.0')
+                n_tokens += 1
         return clean_lines
+
+    @staticmethod
+    def _is_numeric(line):
+        """
+        Slow-path check for lines the regex rejects (e.g., 'nan', 'inf').
+        """
+        try:
+            _ = [float(v) for v in line.split()]
+            return True
+        except ValueError:
+            return False
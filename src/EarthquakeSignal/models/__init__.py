@@ -1,3 +1,3 @@
-from .earthquake_signal import EarthquakeSignal
+from .earthquake_signal import EarthquakeSignal, process_records
 
-__all__ = ["EarthquakeSignal"]
+__all__ = ["EarthquakeSignal", "process_records"]
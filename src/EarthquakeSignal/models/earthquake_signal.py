@@ -12,9 +12,18 @@ Date:
 __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.0.0"
 
+import io
 import os
 import re
-from EarthquakeSignal.core.signal_loader import SignalLoader
+import json
+import contextlib
+import pickle
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from numba import set_num_threads
+from EarthquakeSignal.core.signal_loader import SignalLoader, _has_extension
 from EarthquakeSignal.core.signal_components import SignalComponentIdentifier
 from EarthquakeSignal.core.base_line import BaselineCorrection
 from EarthquakeSignal.core.arias_intensity import AriasIntensityAnalyzer
@@ -32,17 +41,148 @@ from EarthquakeSignal.tools.rotd_plotter import RotDPlotter
 
 from EarthquakeSignal.tools.export_writer import ExportWriter
 
+# Resultados que se guardan en la caché en disco
+_CACHED_ATTRS = ('dt', 'signals_raw', 'signals', 'signals_stack', 'component_names', 'corrected_acc',
+                 'corrected_vel', 'corrected_disp', 'arias', 'fourier', 'newmark_spectra', 'rotd')
+# Versión del formato de la caché: incrementarla cuando cambien los atributos guardados o los
+# cálculos, para que las entradas antiguas no se reutilicen
+_CACHE_VERSION = 2
+# Opciones de salida que no afectan los resultados (no forman parte de la clave)
+_OUTPUT_KEYS = ('print_summary', 'writer', 'use_cache', 'cache_dir')
+
+def _init_record_worker():
+    """
+    Limit numba, scipy.fft and the file reader to one thread per worker process to
+    avoid oversubscription.
+    """
+    set_num_threads(1)
+    FourierAnalyzer.workers = 1
+    SignalLoader.max_threads = 1
+
+
+def _worker_config(config):
+    """
+    Copy of config with summaries, plots and export disabled, for worker processes.
+
+    Workers only compute; the parent process produces the outputs afterwards with
+    `_produce_outputs`, so prints, figures and files are not emitted from several
+    processes at once.
+    """
+    return {k: False if k in ('print_summary', 'writer') or k.startswith('plot_') else v
+            for k, v in config.items()}
+
+
+def _capture_output(func, *args):
+    """
+    Run func(*args) in a worker process and return its result with everything it printed.
+
+    The parent process replays the captured text record by record, so the progress
+    messages of concurrent workers do not interleave.
+
+    Returns
+    -------
+    tuple
+        (result, printed_text)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = func(*args)
+    return result, buffer.getvalue()
+
+
+def _process_one(filepath, config):
+    """
+    Load and analyse one record in a worker process, without printing or plotting.
+
+    Parameters
+    ----------
+    filepath : str
+        Directory containing the record files.
+    config : dict
+        Configuration dictionary with the output switches already disabled.
+
+    Returns
+    -------
+    EarthquakeSignal
+        Processed record.
+    """
+    eq = EarthquakeSignal(filepath, config)
+    eq.name = os.path.basename(os.path.normpath(filepath))
+    eq.load_and_process()
+    return eq
+
+
+def process_records(filepaths, config, n_workers=None):
+    """
+    Process several records in parallel, one worker process per record.
+
+    The analyses run in the workers with summaries, plots and export disabled; those
+    outputs, preceded by each worker's progress messages, are then produced in the
+    calling process from the returned records.
+
+    Parameters
+    ----------
+    filepaths : list of str
+        Directories, each containing the three component files of one record.
+    config : dict
+        Configuration dictionary controlling the processing steps.
+    n_workers : int, optional
+        Number of worker processes. Defaults to os.cpu_count(); use 1 to process
+        the records sequentially in the current process.
+
+    Returns
+    -------
+    list of EarthquakeSignal
+        Processed records, in the order of `filepaths`.
+    """
+    filepaths = list(filepaths)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    if len(filepaths) <= 1 or n_workers <= 1:
+        return [_process_one(fp, config) for fp in filepaths]
+
+    # Los workers solo calculan; la salida (print/plot/export) se hace aquí
+    worker_config = _worker_config(config)
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx,
+                             initializer=_init_record_worker) as executor:
+        results = list(executor.map(_capture_output, [_process_one] * len(filepaths),
+                                    filepaths, [worker_config] * len(filepaths)))
+
+    records = []
+    for eq, log in results:
+        print(log, end='')
+        eq.config = config
+        eq._produce_outputs()
+        records.append(eq)
+    return records
+
+
 class EarthquakeSignal:
     """
     Represents a single processed earthquake record with its seismic signals and analysis options.
     """
 
-    def __init__(self, filepath, config):
+    def __init__(self, filepath, config, files=None):
+        """
+        Parameters
+        ----------
+        filepath : str
+            Directory containing the signal files.
+        config : dict
+            Configuration dictionary controlling the processing steps.
+        files : list of tuple, optional
+            Explicit list of (filename, source) pairs, where source is a file path or
+            an open text stream. When given, `filepath` is not scanned.
+        """
         self.filepath = filepath
         self.config = config
+        self.files = files
         self.name = None
         self.dt = None
         self.signals = {}            # H1, H2, V
+        self.signals_stack = None    # (3, N) array with rows H1, H2, V
         self.component_names = {}    # Map: H1 -> filename
         self.corrected_acc = {}
         self.corrected_vel = {}
@@ -51,6 +191,11 @@ class EarthquakeSignal:
         self.newmark_spectra = {}
         self.rotd = {}
         self.fourier = {}
+        self._time = None            # Vector de tiempo, calculado bajo demanda
+        self._raw_vel = {}           # Integrales de la señal original, calculadas bajo demanda
+        self._raw_disp = {}
+        self._fourier_on_demand = None  # Espectros de Fourier calculados solo para graficar
+        self._newmark_on_demand = None  # Espectros de Newmark calculados solo para graficar
 
         # Tools
         self.summary_tool = EarthquakeSummary(self)
@@ -63,19 +208,32 @@ class EarthquakeSignal:
         self.exporter = ExportWriter(self)
 
     def load_and_process(self):
-        self._load_signal()
-        self._identify_components()
-
-        if self.config.get('apply_baseline_correction', False):
-            self._apply_baseline_correction()
-        if self.config.get('apply_arias_analysis', False):
-            self._compute_arias_intensity()
-        if self.config.get('apply_fourier_analysis', False):
-            self._compute_fourier_analysis()
-        if self.config.get('_compute_newmark_spectra', False):
-            self._compute_newmark_spectra()
-        if self.config.get('compute_rotd', False):
-            self._compute_rotd()
+        cache_path = self._cache_path() if self.config.get('use_cache', False) else None
+        if cache_path and self._load_cache(cache_path):
+            print('-- load cached results-->Done!')
+        else:
+            self._load_signal()
+            self._identify_components()
+
+            if self.config.get('apply_baseline_correction', False):
+                self._apply_baseline_correction()
+            if self.config.get('apply_arias_analysis', False):
+                self._compute_arias_intensity()
+            if self.config.get('apply_fourier_analysis', False):
+                self._compute_fourier_analysis()
+            if self.config.get('_compute_newmark_spectra', False):
+                self._compute_newmark_spectra()
+            if self.config.get('compute_rotd', False):
+                self._compute_rotd()
+            if cache_path:
+                self._save_cache(cache_path)
+
+        self._produce_outputs()
+
+    def _produce_outputs(self):
+        """
+        Print, plot and export the processed record according to the configuration.
+        """
         if self.config.get('print_summary', False):
             self.print_summary()
         if self.config.get('plot_signals', False):
@@ -93,21 +251,126 @@ class EarthquakeSignal:
         if self.config.get('writer', False):
             self.export()
 
+    def _cache_path(self):
+        """
+        Build the cache file path from the input files and the analysis options.
+
+        The key combines the cache format version, the name, size and modification time
+        of every input file and the configuration (plot and output switches excluded), so
+        editing a record, changing an analysis option or upgrading the cache format
+        invalidates the cached results.
+
+        Returns
+        -------
+        str or None
+            Path of the pickle file, or None when an input is an in-memory stream.
+        """
+        if self.files is not None:
+            sources = list(self.files)
+        else:
+            ext = self.config['file_extension']
+            with os.scandir(self.filepath) as entries:
+                sources = [(e.name, e.path) for e in entries if _has_extension(e.name, ext)]
+
+        fingerprint = []
+        for name, source in sorted(sources, key=lambda item: item[0]):
+            if not isinstance(source, (str, os.PathLike)):
+                return None
+            st = os.stat(source)
+            fingerprint.append([name, os.path.abspath(source), st.st_size, st.st_mtime_ns])
+
+        options = {k: v for k, v in self.config.items()
+                   if k not in _OUTPUT_KEYS and not k.startswith('plot_')}
+        payload = json.dumps([_CACHE_VERSION, fingerprint, options], sort_keys=True, default=str)
+        key = hashlib.md5(payload.encode()).hexdigest()
+
+        cache_dir = self.config.get('cache_dir') or os.path.join(os.path.expanduser('~'), '.cache', 'EarthquakeSignal')
+        return os.path.join(cache_dir, f"{key}.pkl")
+
+    def _load_cache(self, cache_path):
+        """
+        Restore previously computed results. Returns False if no usable cache exists.
+
+        Unreadable, truncated or stale files (written by another version of the package,
+        with missing attributes or classes that no longer exist) are treated as a cache
+        miss, so the record is simply recomputed.
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                IndexError, TypeError, ValueError):
+            return False
+        if not isinstance(state, dict) or any(attr not in state for attr in _CACHED_ATTRS):
+            return False
+        for attr in _CACHED_ATTRS:
+            setattr(self, attr, state[attr])
+        # pickle no conserva las vistas: reconstruirlas sobre el bloque (3, N)
+        self.signals = dict(zip(('H1', 'H2', 'V'), self.signals_stack))
+        self.signals_raw = {key: self.signals[comp] for comp, key in self._component_files(self.signals_raw).items()}
+        self._time = None
+        self._raw_vel = {}
+        self._raw_disp = {}
+        self._fourier_on_demand = None
+        self._newmark_on_demand = None
+        return True
+
+    def _save_cache(self, cache_path):
+        """
+        Store the computed results; the file is written atomically.
+        """
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({attr: getattr(self, attr) for attr in _CACHED_ATTRS}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
     def _load_signal(self):
         print('-- start load_signal-->Done!')
-        loader = SignalLoader(self.filepath, self.config['file_extension'])
+        loader = SignalLoader(self.filepath, self.config['file_extension'], files=self.files)
         self.dt, self.signals_raw = loader.read()
-        unit_factor = self.config['unit_factor']
-        self.signals_raw = {k: v / unit_factor for k, v in self.signals_raw.items()}
+        self._time = None
+        self._raw_vel = {}
+        self._raw_disp = {}
+        self._fourier_on_demand = None
+        self._newmark_on_demand = None
 
     def _identify_components(self):
         print('-- start identify components-->Done!')
-        self.signals, self.component_names = SignalComponentIdentifier.identify(self.signals_raw)
+        # La identificación (sufijos o RMS relativo) no depende del factor de unidades
+        _, self.component_names = SignalComponentIdentifier.identify(self.signals_raw)
+        files = self._component_files(self.signals_raw)
+        # Bloque (3, N) en orden H1, H2, V: la conversión de unidades escribe directamente en él
+        comps = ('H1', 'H2', 'V')
+        unit_factor = self.config['unit_factor']
+        first = self.signals_raw[files['H1']]
+        self.signals_stack = np.empty((3, first.shape[0]), dtype=first.dtype)
+        for row, comp in zip(self.signals_stack, comps):
+            np.divide(self.signals_raw[files[comp]], unit_factor, out=row)
+        self.signals = dict(zip(comps, self.signals_stack))
+        # signals_raw conserva los nombres de archivo y apunta a las mismas filas
+        self.signals_raw = {files[comp]: self.signals[comp] for comp in comps}
+
+    def _component_files(self, filenames):
+        """
+        Map each component ('H1', 'H2', 'V') to its filename among `filenames`.
+
+        `component_names` stores the file basenames without extension, so the
+        filenames are matched on that basename.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'H1', 'H2', 'V' and filenames as values.
+        """
+        by_name = {os.path.splitext(os.path.basename(key))[0]: key for key in filenames}
+        return {comp: by_name[self.component_names[comp]] for comp in ('H1', 'H2', 'V')}
 
     def _apply_baseline_correction(self):
         print('-- start apply base line-->Done!')
-        for comp, signal in self.signals.items():
-            acc_corr, vel_corr, disp_corr = BaselineCorrection.apply(signal, self.dt)
+        acc, vel, disp = BaselineCorrection.apply_batch(self.signals_stack, self.dt)
+        for comp, acc_corr, vel_corr, disp_corr in zip(self.signals, acc, vel, disp):
             self.corrected_acc[comp] = acc_corr
             self.corrected_vel[comp] = vel_corr
             self.corrected_disp[comp] = disp_corr
@@ -115,8 +378,9 @@ class EarthquakeSignal:
     def _compute_arias_intensity(self):
         print('-- start compute arias intensity-->Done!')
         self.arias = {}
-        for comp, signal in self.signals.items():
-            IA, t0, t1, ia_total, pot_dest = AriasIntensityAnalyzer.compute(signal, self.dt)
+        results = AriasIntensityAnalyzer.compute_batch(
+            self.signals_stack, self.dt, return_pot=self.config.get('compute_pot_dest', True))
+        for comp, (IA, t0, t1, ia_total, pot_dest) in zip(self.signals, results):
             self.arias[comp] = {
                 'IA_percent': IA,
                 't_start': t0,
@@ -127,24 +391,70 @@ class EarthquakeSignal:
 
     def _compute_fourier_analysis(self):
         print('-- start compute fourier analysis-->Done!')
-        self.fourier = {}
-        for comp, signal in self.signals.items():
-            f, Pyy, dom_freqs, dom_periods, dom_peaks = FourierAnalyzer.compute(signal, self.dt)
-            self.fourier[comp] = {
+        self.fourier = self._fourier_results()
+
+    def _fourier_results(self):
+        """
+        FFT spectra and dominant frequencies of the three components.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'H1', 'H2', 'V' and the Fourier results of each one.
+        """
+        fourier = {}
+        # Las componentes comparten longitud: una sola FFT sobre el bloque (3, N)
+        n_fft = FourierAnalyzer.fft_length(self.signals_stack.shape[1], self.config.get('fourier_fast_len', False))
+        results = FourierAnalyzer.compute_batch(self.signals_stack, self.dt, n_fft=n_fft)
+        for comp, (f, Pyy, dom_freqs, dom_periods, dom_peaks) in zip(self.signals, results):
+            fourier[comp] = {
                 'frequencies': f,
                 'spectrum': Pyy,
                 'dominant_freqs': dom_freqs,
                 'dominant_periods': dom_periods,
                 'dominant_peaks': dom_peaks
             }
+        return fourier
+
+    def ensure_fourier(self):
+        """
+        Fourier results of the record, computed on first use if the analysis was not run.
+
+        Spectra computed here are memoized apart from `fourier`, which keeps reflecting
+        the configured analyses (summary, exports and cache are unaffected).
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'H1', 'H2', 'V', or empty if no signal is loaded.
+        """
+        if self.fourier or not self.signals:
+            return self.fourier
+        if self._fourier_on_demand is None:
+            self._fourier_on_demand = self._fourier_results()
+        return self._fourier_on_demand
 
     def _compute_newmark_spectra(self):
         print('-- start compute newmark spectra->OK')
-        self.newmark_spectra = {}
-        for comp, acc in self.signals.items():
+        self.newmark_spectra = self._newmark_results()
+
+    def _newmark_results(self):
+        """
+        β-Newmark response spectra of the corrected components.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'H1', 'H2', 'V' and the spectra of each one.
+        """
+        newmark_spectra = {}
+        # Un solo kernel paralelo para todas las componentes (componente x periodo)
+        comps = list(self.signals)
+        specs_corr = NewmarkSpectrumAnalyzer.compute_batch(
+            np.stack([self.corrected_acc[comp] for comp in comps]), self.dt)
+        for comp, spec_corr in zip(comps, specs_corr):
             spec = None
-            spec_corr = NewmarkSpectrumAnalyzer.compute(self.corrected_acc[comp], self.dt)
-            self.newmark_spectra[comp] = {
+            newmark_spectra[comp] = {
                 'T': spec['T'] if spec else spec_corr['T'],
                 'Sa': spec['Sa'] if spec else spec_corr['Sa'],
                 'Sv': spec['Sv'] if spec else spec_corr['Sv'],
@@ -163,33 +473,103 @@ class EarthquakeSignal:
                 'u_corr': spec_corr['u'], 'v_corr': spec_corr['v'],
                 'a_corr': spec_corr['a'], 'at_corr': spec_corr['at']
             }
+        return newmark_spectra
+
+    def ensure_newmark_spectra(self):
+        """
+        Newmark spectra of the record, computed on first use if the analysis was not run.
+
+        As in `ensure_fourier`, spectra computed here are memoized apart from
+        `newmark_spectra`, so RotD, exports and the cache are unaffected.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'H1', 'H2', 'V', or empty if there is no corrected signal.
+        """
+        if self.newmark_spectra or not self.corrected_acc:
+            return self.newmark_spectra
+        if self._newmark_on_demand is None:
+            self._newmark_on_demand = self._newmark_results()
+        return self._newmark_on_demand
 
     def _compute_rotd(self):
         print('-- start compute rotd-->Done!')
         h1 = self.corrected_acc['H1']
         h2 = self.corrected_acc['H2']
-        self.rotd = RotDSpectrumAnalyzer.compute_rotd(h1, h2, self.dt)
+
+        # Reutilizar los espectros de H1/H2 ya calculados por Newmark para 0°, 90° y 180°
+        known_psa = None
+        if 'H1' in self.newmark_spectra and 'H2' in self.newmark_spectra:
+            psa_h1 = self.newmark_spectra['H1']['PSa_corr']
+            psa_h2 = self.newmark_spectra['H2']['PSa_corr']
+            known_psa = {0: psa_h1, 90: psa_h2, 180: psa_h1}
+        self.rotd = RotDSpectrumAnalyzer.compute_rotd(h1, h2, self.dt, known_psa=known_psa)
+
+    @property
+    def time(self):
+        """
+        Time vector [s] shared by all components, built once per loaded record.
+        """
+        if self._time is None:
+            self._time = np.arange(len(next(iter(self.signals_raw.values())))) * self.dt
+        return self._time
+
+    def raw_integrals(self, comp):
+        """
+        Velocity and displacement of an original (uncorrected) component.
+
+        Integrated on first use and cached for later plot calls.
+
+        Parameters
+        ----------
+        comp : str
+            Component name ('H1', 'H2' or 'V').
+
+        Returns
+        -------
+        vel : np.ndarray
+            Velocity [m/s].
+        disp : np.ndarray
+            Displacement [m].
+        """
+        if comp not in self._raw_vel:
+            acc = self.signals[comp] * 9.81  # convert from g to m/s²
+            dt = self.dt
+
+            vel = np.empty(len(acc))
+            vel[0] = 0.0
+            np.cumsum((acc[:-1] + acc[1:]) * (dt / 2), out=vel[1:])
+
+            # La recurrencia del desplazamiento es lineal: suma acumulada de los incrementos
+            disp = np.empty(len(acc))
+            disp[0] = 0.0
+            np.cumsum(vel[:-1] * dt + (2 * acc[:-1] + acc[1:]) * (dt ** 2 / 6), out=disp[1:])
+
+            self._raw_vel[comp] = vel
+            self._raw_disp[comp] = disp
+        return self._raw_vel[comp], self._raw_disp[comp]
 
     def print_summary(self):
         self.summary_tool.print_summary()
 
     def plot_original_signals(self, save_svg=True):
-        self.plotter_tool.plot_original_signals(save_svg=save_svg)
+        self.plotter_tool.plot_original_signals(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def plot_corrected_signals(self, save_svg=True):
-        self.comparison_tool.plot_corrected_signals(save_svg=save_svg)
+        self.comparison_tool.plot_corrected_signals(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def plot_arias_signals(self, save_svg=True):
-        self.arias_plotter.plot_arias(save_svg=save_svg)
+        self.arias_plotter.plot_arias(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def plot_fourier_signals(self, save_svg=True):
-        self.fourier_plotter.plot_spectrum(save_svg=save_svg)
+        self.fourier_plotter.plot_spectrum(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def plot_newmark_spectra(self, save_svg=True):
-        self.newmark_plotter.plot_newmark_spectra(save_svg=save_svg)
+        self.newmark_plotter.plot_newmark_spectra(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def plot_rotd(self, save_svg=True):
-        self.rotd_plotter.plot_rotd(save_svg=save_svg)
+        self.rotd_plotter.plot_rotd(save_svg=save_svg, show=self.config.get('plot_show', True))
 
     def export(self, uncorrected=True, corrected=False, newmark_corrected=False):
         self.exporter.export( uncorrected=uncorrected, corrected=corrected, newmark_corrected=newmark_corrected  )
@@ -1,4 +1,6 @@
 from .earthquake_plotter import EarthquakePlotter
+from .earthquake_comparison_plotter import EarthquakeComparisonPlotter
 from .earthquake_summary import EarthquakeSummary
+from .plot_utils import is_headless
 
-__all__ = ["EarthquakePlotter", "EarthquakeSummary"]
+__all__ = ["EarthquakePlotter", "EarthquakeComparisonPlotter", "EarthquakeSummary", "is_headless"]
@@ -14,6 +14,7 @@ __version__ = "1.1.0"
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+from EarthquakeSignal.tools.plot_utils import minmax_downsample, style_axis, is_headless, blit_update, PLOT_POINTS, OUTPUTS_DIR
 
 class AriasPlotter:
     """
@@ -30,8 +31,9 @@ class AriasPlotter:
             and acceleration data.
         """
         self.eq = eq
+        self._fig = None
 
-    def plot_arias(self, save_svg=False):
+    def plot_arias(self, save_svg=False, show=True):
         """
         Plot Arias intensity (normalized) and acceleration signal for each component
         (H1, H2, V) including the significant duration region (5%–95%).
@@ -40,67 +42,125 @@ class AriasPlotter:
         ----------
         save_svg : bool
             If True, saves the figure as an SVG in the outputs/<eq.name>/ folder.
+        show : bool
+            If False, the figure is closed after saving instead of being displayed
+            (batch runs).
         """
+        if not save_svg and (not show or is_headless()):
+            return
         components = ['H1', 'H2', 'V']
         fig, axs = plt.subplots(3, 2, figsize=(15, 10), sharex='col')
         fig.suptitle(f'Arias Intensity and Acceleration with SD - {self.eq.name}', fontsize=11, fontweight='bold')
+        self._fig = fig
+        self._axs = axs
+        self._artists = {}
+        self._blit_cache = {}
 
         for i, comp in enumerate(components):
-            acc = self.eq.signals[comp]
-            dt = self.eq.dt
-            time = np.arange(len(acc)) * dt
-            ia_info = self.eq.arias[comp]
-
-            ia_percent = ia_info['IA_percent']
-            t_start = ia_info['t_start']
-            t_end = ia_info['t_end']
-            ia_total = ia_info['IA_total']
-            pot_dest = ia_info['pot_dest']
-
-            # --- Plot of normalized Arias intensity ---
-            axs[i, 0].plot(time, ia_percent, 'k-', linewidth=1.2)
-            axs[i, 0].axvline(x=t_start, linestyle='--', color='red', linewidth=0.8)
-            axs[i, 0].axvline(x=t_end, linestyle='--', color='red', linewidth=0.8)
-            axs[i, 0].text(t_start+10*dt, 5, f"5%, t={t_start:.2f}s", fontsize=8)
-            axs[i, 0].text(t_end+10*dt, 80, f"95%, t={t_end:.2f}s", fontsize=8)
-            axs[i, 0].set_title(f'{comp} - Arias Intensity', fontsize=9, fontweight='bold')
-            axs[i, 0].set_xlabel('Time [s]', fontsize=9)
-            axs[i, 0].set_ylabel('I$_A$ [%]', fontsize=9)
-            axs[i, 0].tick_params(axis='both', labelsize=8)
-            axs[i, 0].set_xlim(left=0)
-            axs[i, 0].grid(True)
-
-            # --- Textbox with summary statistics ---
-            box_text = '\n'.join([
-                f"SD = {t_end - t_start:.2f} s",
-                f"Ia = {ia_total:.3f} m/s",
-                f"PD = {pot_dest * 100:.2f} cm-s"
-            ])
-            axs[i, 0].text(0.95, 0.5, box_text,
-                           transform=axs[i, 0].transAxes,
-                           fontsize=8, va='center', ha='right',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
-
-            # --- Plot of acceleration with significant duration (SD) overlay ---
-            axs[i, 1].plot(time, acc, color='black', linewidth=0.5, label='Original')
-            mask = (time >= t_start) & (time <= t_end)
-            axs[i, 1].plot(time[mask], acc[mask], color='red', linewidth=1.2, label='SD Segment')
-            axs[i, 1].set_title(f'{comp} - Acceleration with SD', fontsize=9, fontweight='bold')
-            axs[i, 1].set_xlabel('Time [s]', fontsize=9)
-            axs[i, 1].set_ylabel('Acceleration [g]', fontsize=9)
-            axs[i, 1].tick_params(axis='both', labelsize=8)
+            # Los artistas se crean vacíos y se llenan en _set_component_data
+            artists = {
+                'ia': axs[i, 0].plot([], [], 'k-', linewidth=1.2, rasterized=True)[0],
+                'v_start': axs[i, 0].axvline(x=0, linestyle='--', color='red', linewidth=0.8),
+                'v_end': axs[i, 0].axvline(x=0, linestyle='--', color='red', linewidth=0.8),
+                'txt_start': axs[i, 0].text(0, 5, '', fontsize=8),
+                'txt_end': axs[i, 0].text(0, 80, '', fontsize=8),
+                # --- Textbox with summary statistics ---
+                'box': axs[i, 0].text(0.95, 0.5, '',
+                                      transform=axs[i, 0].transAxes,
+                                      fontsize=8, va='center', ha='right',
+                                      bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black')),
+                # --- Plot of acceleration with significant duration (SD) overlay ---
+                'acc': axs[i, 1].plot([], [], color='black', linewidth=0.5, label='Original', rasterized=True)[0],
+                'sd': axs[i, 1].plot([], [], color='red', linewidth=1.2, label='SD Segment', rasterized=True)[0],
+            }
+            self._artists[comp] = artists
+            self._set_component_data(comp)
+
+            style_axis(axs[i, 0], f'{comp} - Arias Intensity', 'Time [s]', 'I$_A$ [%]')
+            style_axis(axs[i, 1], f'{comp} - Acceleration with SD', 'Time [s]', 'Acceleration [g]')
             axs[i, 1].legend(loc='upper right', fontsize=7)
-            axs[i, 1].set_xlim(left=0)
-            axs[i, 1].grid(True)
 
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
+        # Límites de todos los ejes en una sola pasada
+        for ax in axs.flat:
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_xlim(left=0)
+
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "arias_intensity.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg", dpi=150)
         
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    def update(self, blit=False):
+        """
+        Refresh an existing Arias figure with the current data of the EarthquakeSignal
+        (e.g., after reprocessing) by updating the stored artists in place.
+        Does nothing if no figure has been built yet.
+
+        Parameters
+        ----------
+        blit : bool
+            If True, keep the current axis limits and redraw only the data artists over a
+            cached background (fast interactive refresh; see plot_utils.blit_update).
+        """
+        if self._fig is None:
+            return
+        for comp in self._artists:
+            self._set_component_data(comp)
+        if blit and blit_update(self._fig, [a for arts in self._artists.values() for a in arts.values()],
+                                self._blit_cache):
+            return
+        self._blit_cache.clear()
+        for ax in self._axs.flat:
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_xlim(left=0)
+        self._fig.canvas.draw_idle()
+
+    def _set_component_data(self, comp):
+        """
+        Write the Arias curve, SD markers, annotations and acceleration of one component
+        into its stored artists.
+        """
+        artists = self._artists[comp]
+        acc = self.eq.signals[comp]
+        dt = self.eq.dt
+        time = self.eq.time
+        ia_info = self.eq.arias[comp]
+
+        t_start = ia_info['t_start']
+        t_end = ia_info['t_end']
+        ia_total = ia_info['IA_total']
+        pot_dest = ia_info['pot_dest']
+
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
+
+        # --- Normalized Arias intensity and significant duration markers ---
+        artists['ia'].set_data(*minmax_downsample(time, ia_info['IA_percent'], n_out))
+        artists['v_start'].set_xdata([t_start, t_start])
+        artists['v_end'].set_xdata([t_end, t_end])
+        artists['txt_start'].set_position((t_start + 10*dt, 5))
+        artists['txt_start'].set_text(f"5%, t={t_start:.2f}s")
+        artists['txt_end'].set_position((t_end + 10*dt, 80))
+        artists['txt_end'].set_text(f"95%, t={t_end:.2f}s")
+
+        box_lines = [
+            f"SD = {t_end - t_start:.2f} s",
+            f"Ia = {ia_total:.3f} m/s",
+        ]
+        if pot_dest is not None:
+            box_lines.append(f"PD = {pot_dest * 100:.2f} cm-s")
+        artists['box'].set_text('\n'.join(box_lines))
+
+        # El tiempo es creciente: el tramo SD es un corte contiguo [i0, i1)
+        i0 = np.searchsorted(time, t_start)
+        i1 = np.searchsorted(time, t_end, side='right')
+        artists['acc'].set_data(*minmax_downsample(time, acc, n_out))
+        artists['sd'].set_data(*minmax_downsample(time[i0:i1], acc[i0:i1], n_out))
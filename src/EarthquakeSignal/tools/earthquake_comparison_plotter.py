@@ -12,8 +12,8 @@ __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.1.0"
 
 import matplotlib.pyplot as plt
-import numpy as np
 import os
+from EarthquakeSignal.tools.plot_utils import minmax_downsample, style_axis, is_headless, PLOT_POINTS, OUTPUTS_DIR
 
 class EarthquakeComparisonPlotter:
     """
@@ -29,76 +29,118 @@ class EarthquakeComparisonPlotter:
         """
         self.eq = eq
 
-    def plot_corrected_signals(self, save_svg=False):
+    def plot_corrected_signals(self, save_svg=False, show=True):
         """
         Plot comparison of original and corrected signals in three rows (H1, H2, V),
         each showing acceleration, velocity, and displacement.
         """
+        if not save_svg and (not show or is_headless()):
+            return
         components = ['H1', 'H2', 'V']
-        time = np.arange(len(self.eq.signals['H1'])) * self.eq.dt
+        time = self.eq.time
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
 
         fig, axs = plt.subplots(3, 3, figsize=(15, 9), sharex=True)
         fig.suptitle(f'Signal Treatment - {self.eq.name}', fontsize=13, fontweight='bold')
 
         for row, comp in enumerate(components):
-            # Convert acceleration to m/s²
-            acc_raw = self.eq.signals[comp] * 9.81
-
-            # Integrate to velocity and displacement (original)
-            vel_raw = np.cumsum((acc_raw[:-1] + acc_raw[1:]) / 2) * self.eq.dt
-            vel_raw = np.insert(vel_raw, 0, 0.0)
-
-            disp_raw = np.zeros_like(acc_raw)
-            for i in range(1, len(acc_raw)):
-                disp_raw[i] = disp_raw[i-1] + vel_raw[i-1]*self.eq.dt + (2*acc_raw[i-1] + acc_raw[i])*self.eq.dt**2/6
-
-            # Corrected signals
-            acc_corr = self.eq.corrected_acc[comp]
-            vel_corr = self.eq.corrected_vel[comp]
-            disp_corr = self.eq.corrected_disp[comp]
-
-            # Aceleración
-            axs[row, 0].plot(time, acc_raw / 9.81, linestyle='--', color='gray', linewidth=0.8, label='Original')
-            axs[row, 0].plot(time, acc_corr, color='blue', linewidth=0.8, label='Corrected')
-            axs[row, 0].set_ylabel('g', fontsize=9)
-            axs[row, 0].set_title(f'{comp} - Acceleration', fontsize=10, fontweight='bold')
-            axs[row, 0].legend(fontsize=8)
-            axs[row, 0].grid(True)
-            axs[row, 0].tick_params(axis='both', labelsize=8)
-
-            # Velocidad
-            axs[row, 1].plot(time, vel_raw, linestyle='--', color='gray', linewidth=0.8, label='Original')
-            axs[row, 1].plot(time, vel_corr, color='blue', linewidth=0.8, label='Corrected')
-            axs[row, 1].set_ylabel('m/s', fontsize=9)
-            axs[row, 1].set_title(f'{comp} - Velocity', fontsize=10, fontweight='bold')
-            axs[row, 1].legend(fontsize=8)
-            axs[row, 1].grid(True)
-            axs[row, 1].tick_params(axis='both', labelsize=8)
-
-            # Desplazamiento
-            axs[row, 2].plot(time, disp_raw, linestyle='--', color='gray', linewidth=0.8, label='Original')
-            axs[row, 2].plot(time, disp_corr, color='blue', linewidth=0.8, label='Corrected')
-            axs[row, 2].set_ylabel('m', fontsize=9)
-            axs[row, 2].set_title(f'{comp} - Displacement', fontsize=10, fontweight='bold')
-            axs[row, 2].legend(fontsize=8)
-            axs[row, 2].grid(True)
-            axs[row, 2].tick_params(axis='both', labelsize=8)
+            self._plot_component_row(axs[row], comp, time, n_out)
 
         for col in range(3):
             axs[2, col].set_xlabel('Time [s]', fontsize=9)
 
         plt.subplots_adjust(hspace=0.4, wspace=0.25)
 
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "signal_treatment.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg", dpi=150)
         
 
 
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    def plot_component(self, comp='H1', save_svg=False, show=True):
+        """
+        Plot original vs corrected acceleration, velocity, and displacement for a
+        single component in one row.
+
+        Parameters
+        ----------
+        comp : str
+            Component to plot ('H1', 'H2' or 'V').
+        save_svg : bool
+            If True, saves the figure as an SVG in the outputs/<eq.name>/ folder.
+        show : bool
+            If False, the figure is closed after saving instead of being displayed
+            (batch runs).
+        """
+        if not save_svg and (not show or is_headless()):
+            return
+        time = self.eq.time
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
+
+        fig, axs = plt.subplots(1, 3, figsize=(15, 3.5), sharex=True)
+        fig.suptitle(f'Signal Treatment {comp} - {self.eq.name}', fontsize=13, fontweight='bold')
+
+        self._plot_component_row(axs, comp, time, n_out)
+        for ax in axs:
+            ax.set_xlabel('Time [s]', fontsize=9)
+
+        plt.subplots_adjust(wspace=0.25)
+
+        # --- Save to SVG if requested ---
+        if save_svg:
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
+            os.makedirs(output_path, exist_ok=True)
+            file_path = os.path.join(output_path, f"signal_treatment_{comp}.svg")
+            fig.savefig(file_path, format="svg", dpi=150)
+
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    def _plot_component_row(self, axs_row, comp, time, n_out):
+        """
+        Draw the acceleration, velocity and displacement panels of one component.
+
+        Parameters
+        ----------
+        axs_row : sequence of matplotlib.axes.Axes
+            The three axes of the row.
+        comp : str
+            Component name ('H1', 'H2' or 'V').
+        time : np.ndarray
+            Time vector [s].
+        n_out : int or None
+            Number of points per curve after downsampling (None plots every sample).
+        """
+        eq = self.eq
+
+        # Original acceleration is plotted in g as loaded; velocity and displacement
+        # (m/s, m) are integrated from it in m/s² once per record
+        acc_raw = eq.signals[comp]
+        vel_raw, disp_raw = eq.raw_integrals(comp)
+
+        # Corrected signals
+        acc_corr = eq.corrected_acc[comp]
+        vel_corr = eq.corrected_vel[comp]
+        disp_corr = eq.corrected_disp[comp]
+
+        # Aceleración, velocidad y desplazamiento: (título, unidad, original, corregida)
+        panels = [
+            ('Acceleration', 'g', acc_raw, acc_corr),
+            ('Velocity', 'm/s', vel_raw, vel_corr),
+            ('Displacement', 'm', disp_raw, disp_corr),
+        ]
+        for ax, (quantity, unit, raw, corr) in zip(axs_row, panels):
+            ax.plot(*minmax_downsample(time, raw, n_out), linestyle='--', color='gray', linewidth=0.8, label='Original', rasterized=True)
+            ax.plot(*minmax_downsample(time, corr, n_out), color='blue', linewidth=0.8, label='Corrected', rasterized=True)
+            style_axis(ax, f'{comp} - {quantity}', ylabel=unit, title_size=10)
+            ax.legend(fontsize=8)
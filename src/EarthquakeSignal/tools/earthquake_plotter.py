@@ -13,6 +13,7 @@ __version__ = "1.0.0"
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+from EarthquakeSignal.tools.plot_utils import minmax_downsample, style_axis, is_headless, blit_update, PLOT_POINTS, OUTPUTS_DIR
 
 class EarthquakePlotter:
     """
@@ -27,39 +28,76 @@ class EarthquakePlotter:
             Instance of EarthquakeSignal containing time step, signal data, and metadata.
         """
         self.eq = eq
+        self._fig = None
 
-    def plot_original_signals(self, save_svg=False):
+    def plot_original_signals(self, save_svg=False, show=True):
         """
         Plot the original signals for H1, H2, and V in three horizontal subplots (1 row, 3 columns).
         All fonts are standardized for consistent visualization.
         """
-        time = np.arange(len(next(iter(self.eq.signals.values())))) * self.eq.dt
+        if not save_svg and (not show or is_headless()):
+            return
+        time = self.eq.time
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
         components = ['H1', 'H2', 'V']
         titles = ['H1', 'H2', 'V']
+        signals = self.eq.signals
+        names = self.eq.component_names
 
         fig, axs = plt.subplots(1, 3, figsize=(15, 3.5), sharex=True)
+        self._fig = fig
+        self._axs = axs
+        self._lines = {}
+        self._blit_cache = {}
 
         for i, comp in enumerate(components):
-            axs[i].plot(time, self.eq.signals[comp], label=f'{comp} - {self.eq.component_names[comp]}')
-            axs[i].set_xlim(left=0)
-            axs[i].set_xlabel('Time [s]', fontsize=9)
-            axs[i].set_ylabel('Acceleration [g]', fontsize=9)
-            axs[i].set_title(titles[i], fontweight='bold', fontsize=9)
+            self._lines[comp], = axs[i].plot(*minmax_downsample(time, signals[comp], n_out),
+                                             label=f'{comp} - {names[comp]}',
+                                             rasterized=True)
+            style_axis(axs[i], titles[i], 'Time [s]', 'Acceleration [g]', tick_size=9)
             axs[i].legend(loc='upper right', fontsize=9)
-            axs[i].tick_params(axis='both', labelsize=9)
-            axs[i].grid(True)
+            axs[i].set_xlim(left=0)
 
         fig.suptitle(f'Original Ground Motions - {self.eq.name}', fontsize=11, fontweight='bold')
         
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "original_ground_motions.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg", dpi=150)
         
 
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    def update(self, signals=None, blit=False):
+        """
+        Refresh an existing figure in place instead of rebuilding it.
+
+        Parameters
+        ----------
+        signals : dict, optional
+            New signals keyed by 'H1', 'H2', 'V' (same time step). Defaults to the
+            current signals of the EarthquakeSignal.
+        blit : bool
+            If True, keep the current axis limits and redraw only the lines over a cached
+            background (fast interactive refresh; see plot_utils.blit_update).
+        """
+        if self._fig is None:
+            return
+        signals = self.eq.signals if signals is None else signals
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
+        for comp, line in self._lines.items():
+            sig = signals[comp]
+            line.set_data(*minmax_downsample(np.arange(len(sig)) * self.eq.dt, sig, n_out))
+        if blit and blit_update(self._fig, list(self._lines.values()), self._blit_cache):
+            return
+        self._blit_cache.clear()
+        for ax in self._axs:
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_xlim(left=0)
+        self._fig.canvas.draw_idle()
@@ -36,15 +36,16 @@ class EarthquakeSummary:
         print(f"\n{'='*30}")
         print(f"📌 Earthquake ID: {self.eq.name}")
         print(f"Sampling interval (dt): {self.eq.dt:.6f} s")
-        n_samples = len(next(iter(self.eq.signals.values())))
+        signals = self.eq.signals
+        names = self.eq.component_names
+        n_samples = len(next(iter(signals.values())))
         duration = self.eq.dt * n_samples
         print(f"Number of samples: {n_samples}")
         print(f"Total duration: {duration:.2f} s")
         print("Component information:")
 
         for comp in ['H1', 'H2', 'V']:
-            sig = self.eq.signals[comp]
-            rms = np.sqrt(np.mean(sig**2))
-            fname = self.eq.component_names[comp]
-            print(f"  - {comp}: file='{fname}', RMS={rms:.4e}")
+            sig = signals[comp]
+            rms = np.sqrt(np.einsum('i,i->', sig, sig, dtype=np.float64) / sig.size)
+            print(f"  - {comp}: file='{names[comp]}', RMS={rms:.4e}")
         print(f"{'='*30}\n")
@@ -19,6 +19,7 @@ __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.3.0"
 
 import os
+from EarthquakeSignal.tools.plot_utils import OUTPUTS_DIR
 import numpy as np
 
 
@@ -51,10 +52,7 @@ class ExportWriter:
             If True, export corrected Newmark response spectra.
         """
 
-        self.output_path = os.path.join(
-            os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')),
-            'outputs', self.eq.name
-        )
+        self.output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
         os.makedirs(self.output_path, exist_ok=True)
 
         self.component_map = {'H1': 'N', 'H2': 'E', 'V': 'Z'}
@@ -84,18 +82,16 @@ class ExportWriter:
         suffix : str
             Suffix for the file name (e.g., '_acc', '_acc_cor').
         """
-        n = len(next(iter(signal_dict.values())))
-        time = np.arange(0, n * self.eq.dt, self.eq.dt)
+        time = self.eq.time
+        names = self.eq.component_names
 
         for comp, label in self.component_map.items():
             if comp not in signal_dict:
                 continue
             data = signal_dict[comp]
-            filename = f"{self.eq.component_names[comp]}_{label}{suffix}.txt"
+            filename = f"{names[comp]}_{label}{suffix}.txt"
             filepath = os.path.join(self.output_path, filename)
-            with open(filepath, 'w') as f:
-                for t, a in zip(time, data):
-                    f.write(f"{t:.6f}\t{a:.6e}\n")
+            self._write_columns(filepath, time, data)
 
     def _export_spectra(self, spectra_dict, suffix):
         """
@@ -108,6 +104,7 @@ class ExportWriter:
         suffix : str
             Suffix for the file name (e.g., '_spectra_cor').
         """
+        names = self.eq.component_names
         for comp, label in self.component_map.items():
             if comp not in spectra_dict:
                 continue
@@ -117,8 +114,29 @@ class ExportWriter:
             if T is None or Sa is None:
                 continue
 
-            filename = f"{self.eq.component_names[comp]}_{label}{suffix}.txt"
+            filename = f"{names[comp]}_{label}{suffix}.txt"
             filepath = os.path.join(self.output_path, filename)
-            with open(filepath, 'w') as f:
-                for t, sa in zip(T, Sa):
-                    f.write(f"{t:.6f}\t{sa:.6e}\n")
+            self._write_columns(filepath, T, Sa)
+
+    @staticmethod
+    def _write_columns(filepath, x, y):
+        """
+        Write two columns as tab-separated text ("%.6f\t%.6e" per line).
+
+        The whole file is formatted into a single string from plain Python floats and
+        written at once, instead of formatting and writing line by line.
+
+        Parameters
+        ----------
+        filepath : str
+            Output file path.
+        x : np.ndarray
+            First column (time or period) [s].
+        y : np.ndarray
+            Second column, same length as x.
+        """
+        values = np.empty(2 * len(x))
+        values[0::2] = x
+        values[1::2] = y
+        with open(filepath, 'w') as f:
+            f.write("%.6f\t%.6e\n" * len(x) % tuple(values.tolist()))
@@ -12,8 +12,10 @@ __version__ = "1.0.0"
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from EarthquakeSignal.core.fourier_analyzer import FourierAnalyzer
 import os
+from EarthquakeSignal.tools.plot_utils import minmax_downsample_log, is_headless, reuse_or_create, PLOT_POINTS, OUTPUTS_DIR
 
 class FourierPlotter:
     """
@@ -28,8 +30,11 @@ class FourierPlotter:
             Instance of EarthquakeSignal containing time step and signals.
         """
         self.eq = eq
+        self._fig = None
+        self._axs = None
+        self._peaks = {}  # (comp, num_frequencies) -> (spectrum, picos) buscados al graficar
 
-    def plot_spectrum(self, num_frequencies=4 , save_svg=False):
+    def plot_spectrum(self, num_frequencies=4 , save_svg=False, show=True):
         """
         Plot the FFT spectrum for all components (H1, H2, V) with dominant frequencies highlighted.
 
@@ -37,33 +42,56 @@ class FourierPlotter:
         ----------
         num_frequencies : int
             Number of dominant frequencies to annotate.
+        save_svg : bool
+            If True, saves the figure as an SVG in the outputs/<eq.name>/ folder.
+        show : bool
+            If False, the figure is closed after saving instead of being displayed
+            (batch runs).
         """
+        if not save_svg and (not show or is_headless()):
+            return
         components = ['H1', 'H2', 'V']
-        fig, axs = plt.subplots(3, 1, figsize=(15, 9), sharey=True)
+        # Espectros del registro; si el análisis estaba desactivado se calculan una sola vez
+        fourier = self.eq.ensure_fourier()
+        names = self.eq.component_names
+        n_out = PLOT_POINTS if self.eq.config.get('plot_downsample', True) else None
+        # Si la figura anterior sigue abierta se limpia y se reutiliza en lugar de crear otra
+        fig, axs = reuse_or_create(self._fig, self._axs, 3, 1, figsize=(15, 9), sharey=True)
+        self._fig, self._axs = fig, axs
 
         for i, comp in enumerate(components):
-            if comp not in self.eq.fourier:
+            if comp not in fourier:
                 print(f"[WARNING] No Fourier data found for component '{comp}', skipping.")
                 continue
 
-            data = self.eq.fourier[comp]
+            data = fourier[comp]
 
             freqs = data['frequencies']
             Pyy = data['spectrum']
-            dom_freqs = data['dominant_freqs'][:num_frequencies]
-            dom_periods = data['dominant_periods'][:num_frequencies]
-            dom_peaks = data['dominant_peaks'][:num_frequencies]
-            
-
-            axs[i].semilogx(freqs, Pyy, linewidth=1.2, color='black')
+            if num_frequencies <= len(data['dominant_freqs']):
+                dom_freqs = data['dominant_freqs'][:num_frequencies]
+                dom_periods = data['dominant_periods'][:num_frequencies]
+                dom_peaks = data['dominant_peaks'][:num_frequencies]
+            else:
+                # Más picos de los guardados: se buscan sobre el espectro ya calculado, sin repetir
+                # la FFT, y se conservan para los siguientes replots del mismo espectro
+                cached = self._peaks.get((comp, num_frequencies))
+                if cached is None or cached[0] is not Pyy:
+                    cached = (Pyy, FourierAnalyzer.dominant_peaks(freqs, Pyy, num_frequencies))
+                    self._peaks[(comp, num_frequencies)] = cached
+                dom_freqs, dom_periods, dom_peaks = cached[1]
+
+
+            axs[i].semilogx(*minmax_downsample_log(freqs, Pyy, n_out), linewidth=1.2, color='black')
             axs[i].scatter(dom_freqs, dom_peaks, color='blue', s=30, zorder=5)
 
-            # Etiquetas f1, f2...
-            for j, (f, A) in enumerate(zip(dom_freqs, dom_peaks)):
-                axs[i].annotate(f"f{j+1}", xy=(f, A), xytext=(f, A * 1.05),
-                                textcoords="data", fontsize=8,
-                                ha='center',
-                                arrowprops=dict(arrowstyle="->", lw=0.5, color='gray'))
+            # Etiquetas f1, f2... sobre cada pico; los marcadores se dibujan como una sola colección
+            label_y = dom_peaks * 1.05
+            segs = np.stack([np.column_stack((dom_freqs, label_y)),
+                             np.column_stack((dom_freqs, dom_peaks))], axis=1)
+            axs[i].add_collection(LineCollection(segs, colors='gray', linewidths=0.5), autolim=False)
+            for j, (f, y) in enumerate(zip(dom_freqs, label_y)):
+                axs[i].text(f, y, f"f{j+1}", fontsize=8, ha='center')
 
             # Texto en cuadro blanco
             lines = [f"f{j+1} = {f:.2f} Hz / T = {T:.2f} s" for j, (f, T) in enumerate(zip(dom_freqs, dom_periods))]
@@ -75,7 +103,7 @@ class FourierPlotter:
                         horizontalalignment='right',
                         bbox=dict(facecolor='white', edgecolor='black'))
 
-            axs[i].set_title(f"{comp} - {self.eq.component_names[comp]}", fontsize=10, fontweight='bold')
+            axs[i].set_title(f"{comp} - {names[comp]}", fontsize=10, fontweight='bold')
             if i == 2:
                 axs[i].set_xlabel('Frequency [Hz]', fontsize=9)
             axs[i].tick_params(axis='both', labelsize=8)
@@ -84,15 +112,15 @@ class FourierPlotter:
             axs[i].set_ylabel('Power Amplitude', fontsize=9)
         fig.suptitle(f"FFT Spectrum with Dominant Frequencies - {self.eq.name}", fontsize=11, fontweight='bold')
 
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "fft_spectrum.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg")
         
 
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
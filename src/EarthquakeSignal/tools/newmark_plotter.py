@@ -13,7 +13,9 @@ __author__ = "Ing. Patricio Palacios B., M.Sc."
 __version__ = "1.0.1"
 
 import matplotlib.pyplot as plt
+import numpy as np
 import os
+from EarthquakeSignal.tools.plot_utils import is_headless, blit_update, reuse_or_create, OUTPUTS_DIR
 
 class NewmarkPlotter:
     """
@@ -30,31 +32,50 @@ class NewmarkPlotter:
             Instance containing acceleration data and metadata for a single record.
         """
         self.eq = eq
+        self._fig = None
+        self._axs = None
 
-    def plot_newmark_spectra(self, save_svg=False):
+    def plot_newmark_spectra(self, save_svg=False, show=True):
         """
         Plot pseudo-acceleration (PSa), pseudo-velocity (PSv), and displacement (Sd) spectra
         in a single row with three columns. Each subplot includes the three components
         H1, H2, and V using consistent formatting. Original (uncorrected) spectra
         are shown as dashed gray lines, corrected in solid colors.
         """
+        if not save_svg and (not show or is_headless()):
+            return
         components = ['H1', 'H2', 'V']
         colors = {'H1': 'black', 'H2': 'red', 'V': 'blue'}
 
-        fig, axs = plt.subplots(1, 3, figsize=(15, 3.5), sharex=True)
+        # Espectros del registro; si el análisis estaba desactivado se integran una sola vez
+        spectra = self.eq.ensure_newmark_spectra()
 
-        for comp in components:
-            data = self.eq.newmark_spectra.get(comp, None)
-
-            T = data['T']
-            axs[0].plot(T, data['PSa'], linestyle='--', color=[0.6, 0.6, 0.6], linewidth=1)
-            axs[0].plot(T, data['PSa_corr'], color=colors[comp], linewidth=1.2, label=f"{comp} (PGA={data['PSa_corr'][0]:.3f}g)")
-
-            axs[1].plot(T, data['PSv'], linestyle='--', color=[0.6, 0.6, 0.6], linewidth=1)
-            axs[1].plot(T, data['PSv_corr'], color=colors[comp], linewidth=1.2, label=comp)
+        fig, axs = reuse_or_create(self._fig, self._axs, 1, 3, figsize=(15, 3.5), sharex=True)
+        self._fig = fig
+        self._axs = axs
+        self._lines = {}
+        self._blit_cache = {}
 
-            axs[2].plot(T, data['Sd'], linestyle='--', color=[0.6, 0.6, 0.6], linewidth=1)
-            axs[2].plot(T, data['Sd_corr'], color=colors[comp], linewidth=1.2, label=comp)
+        for comp in components:
+            if comp not in spectra:
+                print(f"[WARNING] No Newmark spectra found for component '{comp}', skipping.")
+        comps = [comp for comp in components if comp in spectra]
+
+        # Las componentes comparten el vector de periodos: una llamada a plot por estilo y
+        # cantidad, con una columna por componente (originales primero, corregidas encima)
+        if comps:
+            T = spectra[comps[0]]['T']
+            for ax, key in zip(axs, ('PSa', 'PSv', 'Sd')):
+                labels = [f"{comp} (PGA={spectra[comp]['PSa_corr'][0]:.3f}g)" if key == 'PSa' else comp
+                          for comp in comps]
+                orig = ax.plot(T, np.column_stack([spectra[comp][key] for comp in comps]),
+                               linestyle='--', color=[0.6, 0.6, 0.6], linewidth=1)
+                corr = ax.plot(T, np.column_stack([spectra[comp][key + '_corr'] for comp in comps]),
+                               linewidth=1.2, label=labels)
+                for comp, line_orig, line_corr in zip(comps, orig, corr):
+                    line_corr.set_color(colors[comp])
+                    self._lines[(comp, key)] = line_orig
+                    self._lines[(comp, key + '_corr')] = line_corr
 
         # Acceleration spectrum
         axs[0].set_title('Acceleration Spectrum', fontweight='bold', fontsize=9)
@@ -85,15 +106,47 @@ class NewmarkPlotter:
 
         fig.suptitle(f'Newmark Response Spectra - {self.eq.name}', fontsize=11, fontweight='bold')
 
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "newmark_response_spectra.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg")
         
 
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    def update(self, blit=False):
+        """
+        Refresh an existing spectra figure with the current newmark_spectra of the
+        EarthquakeSignal (e.g., after reprocessing) by updating the stored lines in place.
+        Does nothing if no figure has been built yet.
+
+        Parameters
+        ----------
+        blit : bool
+            If True, keep the current axis limits and legend and redraw only the spectra
+            over a cached background (fast interactive refresh; see plot_utils.blit_update).
+        """
+        if self._fig is None:
+            return
+        spectra = self.eq.ensure_newmark_spectra()
+        for (comp, key), line in self._lines.items():
+            data = spectra.get(comp)
+            if data is None:
+                continue
+            line.set_data(data['T'], data[key])
+            if key == 'PSa_corr':
+                line.set_label(f"{comp} (PGA={data['PSa_corr'][0]:.3f}g)")
+        if blit and blit_update(self._fig, list(self._lines.values()), self._blit_cache):
+            return
+        self._blit_cache.clear()
+        for ax in self._axs:
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_xlim(left=0)
+        self._axs[0].legend(fontsize=8)
+        self._fig.canvas.draw_idle()
@@ -0,0 +1,223 @@
+"""
+Description:
+    This module provides helper functions shared by the plotting tools, such as the
+    reduction of long time histories to the number of points that can actually be seen
+    on screen before handing them to matplotlib.
+
+Date:
+    2025-06-20
+"""
+
+__author__ = "Ing. Patricio Palacios B., M.Sc."
+__version__ = "1.0.0"
+
+import os
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Puntos por curva tras la reducción: suficiente para el ancho de un eje en pantalla
+PLOT_POINTS = 4000
+
+# Carpeta de salida del proyecto (<raíz>/outputs), resuelta una sola vez al importar
+OUTPUTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'outputs'))
+
+
+def minmax_downsample(t, y, n_out=PLOT_POINTS):
+    """
+    Reduce a time history to a min/max envelope for plotting.
+
+    The signal is split into n_out // 2 buckets and only the minimum and maximum of each
+    bucket are kept (in time order), so peaks remain exactly visible while the number of
+    line segments drawn by matplotlib is bounded.
+
+    Parameters
+    ----------
+    t : np.ndarray
+        Time vector [s].
+    y : np.ndarray
+        Signal values, same length as t.
+    n_out : int or None
+        Approximate number of output points. If None, or if the signal is already short,
+        the inputs are returned unchanged.
+
+    Returns
+    -------
+    t_ds : np.ndarray
+        Downsampled time vector.
+    y_ds : np.ndarray
+        Downsampled signal values.
+    """
+    n = len(y)
+    if n_out is None or n <= n_out or n_out < 4:
+        return t, y
+
+    bucket = -(-n // (n_out // 2))  # ceil
+    n_full = n // bucket
+
+    # Índices de mínimo y máximo de cada bucket completo, ordenados en el tiempo
+    body = y[:n_full * bucket].reshape(n_full, bucket)
+    start = np.arange(n_full) * bucket
+    pairs = np.column_stack((start + body.argmin(axis=1), start + body.argmax(axis=1)))
+    pairs.sort(axis=1)
+    idx = [[0], pairs.ravel()]
+
+    # Último bucket incompleto
+    if n_full * bucket < n:
+        tail = y[n_full * bucket:]
+        idx.append(np.sort(n_full * bucket + np.array([tail.argmin(), tail.argmax()])))
+    idx.append([n - 1])
+
+    idx = np.unique(np.concatenate(idx))
+    return t[idx], y[idx]
+
+
+def style_axis(ax, title=None, xlabel=None, ylabel=None, title_size=9, label_size=9, tick_size=8):
+    """
+    Apply the common title, labels, tick size and grid of the plotting tools to an axis.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axis to format.
+    title, xlabel, ylabel : str, optional
+        Texts to set; None leaves the corresponding element unchanged.
+    title_size, label_size, tick_size : int
+        Font sizes of the bold title, the axis labels and the tick labels.
+    """
+    if title is not None:
+        ax.set_title(title, fontsize=title_size, fontweight='bold')
+    if xlabel is not None:
+        ax.set_xlabel(xlabel, fontsize=label_size)
+    if ylabel is not None:
+        ax.set_ylabel(ylabel, fontsize=label_size)
+    ax.tick_params(axis='both', labelsize=tick_size)
+    ax.grid(True)
+
+
+def is_headless():
+    """
+    Whether figures can only be written to file, never displayed.
+
+    True for the non-interactive backends (Agg, PDF, SVG) unless the FORCE_PLOT environment
+    variable is set. The plotters use it to skip building figures that are neither shown nor
+    saved (call matplotlib.use('Agg') before importing the package on batch runs).
+
+    Returns
+    -------
+    bool
+        True when plotting without saving would produce no output.
+    """
+    return matplotlib.get_backend().lower() in ('agg', 'pdf', 'svg') and not os.environ.get('FORCE_PLOT')
+
+
+def blit_update(fig, artists, cache):
+    """
+    Redraw only the given artists over a cached static background (matplotlib blitting).
+
+    On the first call the figure is rendered once without the artists and that background is
+    stored in cache; later calls restore it, draw the artists on top and blit the figure, so
+    axes, ticks, grids and legends are not re-rendered. The axis limits are therefore kept
+    fixed: clear the cache whenever the limits or the static content change.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure holding the artists.
+    artists : sequence of matplotlib.artist.Artist
+        Artists whose data changed.
+    cache : dict
+        Holder for the background ('bg' key), owned by the caller.
+
+    Returns
+    -------
+    bool
+        False if the canvas cannot blit; the caller should then redraw normally.
+    """
+    canvas = fig.canvas
+    if not getattr(canvas, 'supports_blit', False):
+        return False
+    if 'bg' not in cache:
+        for artist in artists:
+            artist.set_animated(True)
+        canvas.draw()
+        cache['bg'] = canvas.copy_from_bbox(fig.bbox)
+        for artist in artists:
+            artist.set_animated(False)
+    canvas.restore_region(cache['bg'])
+    for artist in artists:
+        fig.draw_artist(artist)
+    canvas.blit(fig.bbox)
+    canvas.flush_events()
+    return True
+
+
+def reuse_or_create(fig, axs, *args, **kwargs):
+    """
+    Reuse a plotter's previous figure if it is still open, otherwise create a new one.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure or None
+        Figure built by a previous call (None on the first call).
+    axs : matplotlib.axes.Axes or array of Axes
+        Axes of that figure; they are cleared before being returned.
+    *args, **kwargs
+        Arguments passed to plt.subplots when a new figure is needed.
+
+    Returns
+    -------
+    fig, axs
+        The figure and its (empty) axes, as returned by plt.subplots.
+    """
+    if fig is not None and plt.fignum_exists(fig.number):
+        for ax in np.ravel(axs):
+            ax.clear()
+        return fig, axs
+    return plt.subplots(*args, **kwargs)
+
+
+def minmax_downsample_log(f, y, n_out=PLOT_POINTS):
+    """
+    Reduce a spectrum drawn on a logarithmic frequency axis to a min/max envelope.
+
+    Same idea as `minmax_downsample`, but the positive frequencies are split into
+    n_out // 2 log-spaced bins, so every decade keeps its share of the axis width. Low
+    frequency bins that hold a single sample keep it unchanged; points with f <= 0 (not
+    visible on a log axis) are kept as they are.
+
+    Parameters
+    ----------
+    f : np.ndarray
+        Frequency vector [Hz], non-decreasing.
+    y : np.ndarray
+        Spectrum values, same length as f.
+    n_out : int or None
+        Approximate number of output points. If None, or if the spectrum is already
+        short, the inputs are returned unchanged.
+
+    Returns
+    -------
+    f_ds : np.ndarray
+        Downsampled frequency vector.
+    y_ds : np.ndarray
+        Downsampled spectrum values.
+    """
+    n = len(y)
+    if n_out is None or n <= n_out or n_out < 4:
+        return f, y
+    i0 = np.searchsorted(f, 0.0, side='right')  # primer índice con f > 0
+    if i0 >= n - 1:
+        return f, y
+
+    # Bin logarítmico de cada punto; dentro de cada bin, orden por valor para tomar mín y máx
+    edges = np.geomspace(f[i0], f[-1], n_out // 2 + 1)
+    bins = np.searchsorted(edges, f[i0:], side='right')
+    order = np.lexsort((y[i0:], bins))
+    sorted_bins = bins[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+
+    idx = np.unique(np.concatenate((np.arange(i0), i0 + order[starts], i0 + order[ends], [n - 1])))
+    return f[idx], y[idx]
@@ -1,6 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import os
+from EarthquakeSignal.tools.plot_utils import is_headless, reuse_or_create, OUTPUTS_DIR
 
 class RotDPlotter:
     """
@@ -16,12 +19,16 @@ class RotDPlotter:
             Instance of EarthquakeSignal with corrected accelerations and RotD results.
         """
         self.eq = eq
+        self._fig = None
+        self._axs = None
 
-    def plot_rotd(self, save_svg=False):
+    def plot_rotd(self, save_svg=False, show=True):
         """
         Plot the acceleration orbit (H1 vs H2) and overlay RotD00, RotD50, and RotD100 angles.
         Also plot the response spectra in an adjacent subplot with all annotations and legend.
         """
+        if not save_svg and (not show or is_headless()):
+            return
         a1 = self.eq.corrected_acc['H1']
         a2 = self.eq.corrected_acc['H2']
         T = self.eq.rotd['T']
@@ -34,17 +41,15 @@ class RotDPlotter:
         angle_50 = self.eq.rotd['angle_rotd50']
         angle_100 = self.eq.rotd['angle_rotd100']
 
-        pga_h1 = np.max(np.abs(a1))
-        pga_h2 = np.max(np.abs(a2))
-        pga_00 = np.max(psa_00)
-        pga_50 = np.max(psa_50)
-        pga_100 = np.max(psa_100)
+        pga_h1, pga_h2 = np.max(np.abs(np.stack([a1, a2])), axis=1)
+        pga_00, pga_50, pga_100 = np.max(np.stack([psa_00, psa_50, psa_100]), axis=1)
 
-        theta_00 = angle_00[0] if isinstance(angle_00, (list, np.ndarray)) else angle_00
-        theta_50 = angle_50[0] if isinstance(angle_50, (list, np.ndarray)) else angle_50
-        theta_100 = angle_100[0] if isinstance(angle_100, (list, np.ndarray)) else angle_100
+        # Ángulo del primer periodo (acepta escalar, lista o arreglo)
+        theta_00, theta_50, theta_100 = (np.asarray(a).ravel()[0] for a in (angle_00, angle_50, angle_100))
 
-        fig, axs = plt.subplots(1, 2, figsize=(15, 4))
+        # Si la figura anterior sigue abierta se limpia y se reutiliza en lugar de crear otra
+        fig, axs = reuse_or_create(self._fig, self._axs, 1, 2, figsize=(15, 4))
+        self._fig, self._axs = fig, axs
 
         # Subplot 1: Response Spectra
         axs[0].plot(T, psa_h1, '--', linewidth=1.2, color=[0.5, 0.5, 0.5], label=f"{self.eq.component_names['H1']} (PGA={pga_h1:.3f}g)")
@@ -61,40 +66,44 @@ class RotDPlotter:
         axs[0].set_xlim(left=0)
 
         # Subplot 2: Acceleration Orbit
-        axs[1].plot(a1, a2, color='blue', linewidth=1.25, label='Acceleration Orbit')
+        orbit, = axs[1].plot(a1, a2, color='blue', linewidth=1.25, label='Acceleration Orbit', rasterized=True)
         axs[1].axis('equal')
 
         # Define axis limits from data range
-        lim_x = [np.min(a1) - 0.005, np.max(a1) + 0.005]
-        x = np.linspace(lim_x[0], lim_x[1], 500)
-
-        def plot_rotd_line(ax, theta_deg, style, color, label):
-            theta_rad = np.deg2rad(theta_deg)
-            y = np.tan(theta_rad) * x
-            ax.plot(x, y, style, color=color, linewidth=1.2, label=label)
-
-        plot_rotd_line(axs[1], theta_100, '-', 'red', f'RotD100 ({theta_100}°)')
-        plot_rotd_line(axs[1], theta_50, '--', [0, 0.45, 0.74], f'RotD50 ({theta_50}°)')
-        plot_rotd_line(axs[1], theta_00, '--', [0.2, 0.6, 0], f'RotD00 ({theta_00}°)')
+        lim_x = np.array([np.min(a1) - 0.005, np.max(a1) + 0.005])
+
+        # Rectas RotD (y = tan(θ)·x): dos extremos por recta, dibujadas como una sola colección
+        rotd_lines = [
+            (theta_100, '-', 'red', f'RotD100 ({theta_100}°)'),
+            (theta_50, '--', [0, 0.45, 0.74], f'RotD50 ({theta_50}°)'),
+            (theta_00, '--', [0.2, 0.6, 0], f'RotD00 ({theta_00}°)'),
+        ]
+        slopes = np.tan(np.deg2rad([theta for theta, _, _, _ in rotd_lines]))
+        segs = np.stack([np.broadcast_to(lim_x, (len(slopes), 2)), slopes[:, None] * lim_x], axis=-1)
+        axs[1].add_collection(LineCollection(segs, colors=[c for _, _, c, _ in rotd_lines],
+                                             linestyles=[s for _, s, _, _ in rotd_lines],
+                                             linewidths=1.2), autolim=False)
+        handles = [orbit] + [Line2D([], [], linestyle=s, color=c, linewidth=1.2, label=label)
+                             for _, s, c, label in rotd_lines]
 
         axs[1].set_xlim(lim_x)
         axs[1].set_ylim([np.min(a2) - 0.005, np.max(a2) + 0.005])
         axs[1].set_xlabel('H1 Acceleration [g]', fontsize=9, fontweight='bold')
         axs[1].set_ylabel('H2 Acceleration [g]', fontsize=9, fontweight='bold')
         axs[1].set_title('Acceleration Orbit', fontsize=10, fontweight='bold')
-        axs[1].legend(fontsize=7)
+        axs[1].legend(handles=handles, fontsize=7)
         axs[1].grid(True)
 
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        output_path = os.path.join(project_root, 'outputs', self.eq.name)
         # --- Save to SVG if requested ---
         if save_svg:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-            output_path = os.path.join(project_root, 'outputs', self.eq.name)
+            output_path = os.path.join(OUTPUTS_DIR, self.eq.name)
             os.makedirs(output_path, exist_ok=True)
             file_path = os.path.join(output_path, "rotd.svg")
-            plt.savefig(file_path, format="svg")
+            fig.savefig(file_path, format="svg", dpi=150)
         
 
 
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
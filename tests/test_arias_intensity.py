@@ -0,0 +1,17 @@
+import numpy as np
+
+from EarthquakeSignal.core.arias_intensity import AriasIntensityAnalyzer
+
+
+def test_compute_batch_thresholds_match_per_row_search():
+    rng = np.random.default_rng(1)
+    signals = rng.standard_normal((3, 2000)) * np.linspace(0.1, 1.0, 2000)
+    dt = 0.005
+
+    results = AriasIntensityAnalyzer.compute_batch(signals, dt)
+
+    for (IA_percent, t_start, t_end, _, _), row in zip(results, signals):
+        assert np.all(np.diff(IA_percent) >= 0)
+        expected = np.searchsorted(IA_percent, [5, 95]) * dt
+        assert (t_start, t_end) == tuple(expected)
+        assert IA_percent[int(round(t_start / dt))] >= 5 > IA_percent[int(round(t_start / dt)) - 1]
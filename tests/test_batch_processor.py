@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pytest
+
+from EarthquakeSignal.batch.earthquake_batch_processor import EarthquakeBatchProcessor, _process_group_worker
+from EarthquakeSignal.config import config
+from EarthquakeSignal.core.signal_loader import _has_extension
+
+
+def _load_only_config():
+    cfg = {k: (False if k.startswith(('plot_', 'apply_', 'compute_', '_compute_')) else v)
+           for k, v in config.items()}
+    cfg.update(unit_factor=1.0, use_cache=False, print_summary=False, writer=False)
+    return cfg
+
+
+def _write_two_columns(path, n, dt=0.005, scale=1.0):
+    t = np.arange(n) * dt
+    acc = scale * np.sin(t)
+    np.savetxt(path, np.column_stack((t, acc)), fmt='%.6f %.6e')
+    return acc
+
+
+def test_two_column_files_are_converted(tmp_path):
+    names = ['REC_X.txt', 'REC_Y.txt', 'REC_Z.txt']
+    accs = [_write_two_columns(tmp_path / name, 200, scale=i + 1) for i, name in enumerate(names)]
+
+    group_id, eq = _process_group_worker(str(tmp_path), 'REC', names, _load_only_config())
+
+    assert group_id == 'REC'
+    assert eq.dt == pytest.approx(0.005)
+    for comp, acc in zip(('H1', 'H2', 'V'), accs):
+        np.testing.assert_allclose(eq.signals[comp], acc, rtol=1e-5, atol=1e-6)
+
+
+def test_two_column_malformed_value_raises(tmp_path):
+    names = ['REC_X.txt', 'REC_Y.txt', 'REC_Z.txt']
+    for name in names:
+        _write_two_columns(tmp_path / name, 200)
+    with open(tmp_path / names[0], 'a') as f:
+        f.write('1.0 abc\n')
+
+    with pytest.raises(ValueError):
+        _process_group_worker(str(tmp_path), 'REC', names, _load_only_config())
+
+
+def test_group_by_identifier_matches_extension_case_insensitively(tmp_path):
+    for name in ('RSN1_A.AT2', 'RSN1_B.at2', 'RSN1_C.At2', 'RSN2_A.txt'):
+        (tmp_path / name).write_text('')
+
+    groups = EarthquakeBatchProcessor(str(tmp_path), {'file_extension': '.AT2'})._group_by_identifier()
+
+    assert sorted(groups) == ['RSN1']
+    assert sorted(groups['RSN1']) == ['RSN1_A.AT2', 'RSN1_B.at2', 'RSN1_C.At2']
+
+
+@pytest.mark.parametrize('ext', ['AT2', '.AT2.txt'])
+def test_group_by_identifier_agrees_with_loader(tmp_path, ext):
+    for name in ('RSN1_A.AT2.txt', 'RSN1_B.at2.TXT', 'RSN2_A.txt', 'RSN3_A.At2'):
+        (tmp_path / name).write_text('')
+
+    groups = EarthquakeBatchProcessor(str(tmp_path), {'file_extension': ext})._group_by_identifier()
+    with os.scandir(tmp_path) as entries:
+        loaded = sorted(e.name for e in entries if _has_extension(e.name, ext))
+
+    assert loaded
+    assert sorted(f for files in groups.values() for f in files) == loaded
+
+
+def test_process_all_is_sequential_by_default(tmp_path, monkeypatch):
+    from EarthquakeSignal.batch import earthquake_batch_processor as ebp
+
+    for group in ('A', 'B'):
+        for comp in ('X', 'Y', 'Z'):
+            _write_two_columns(tmp_path / f'{group}_{comp}.txt', 100)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError('process_all started worker processes by default')
+
+    monkeypatch.setattr(ebp, 'ProcessPoolExecutor', no_pool)
+    cfg = _load_only_config()
+    cfg['file_extension'] = '.txt'
+    records = EarthquakeBatchProcessor(str(tmp_path), cfg).process_all()
+
+    assert sorted(records) == ['A', 'B']
+
+
+def test_record_worker_initializer_limits_threads(monkeypatch):
+    from EarthquakeSignal.core.fourier_analyzer import FourierAnalyzer
+    from EarthquakeSignal.core.signal_loader import SignalLoader
+    from EarthquakeSignal.models import earthquake_signal
+
+    monkeypatch.setattr(FourierAnalyzer, 'workers', -1)
+    monkeypatch.setattr(SignalLoader, 'max_threads', 8)
+    monkeypatch.setattr(earthquake_signal, 'set_num_threads', lambda n: None)
+
+    earthquake_signal._init_record_worker()
+
+    assert FourierAnalyzer.workers == 1
+    assert SignalLoader.max_threads == 1
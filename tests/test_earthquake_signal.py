@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from EarthquakeSignal.config import config
+from EarthquakeSignal.models.earthquake_signal import EarthquakeSignal
+
+UNIT_FACTOR = 9.81
+
+
+def _config(cache_dir):
+    cfg = {k: (False if k.startswith(('plot_', 'apply_', 'compute_', '_compute_')) else v)
+           for k, v in config.items()}
+    cfg.update(unit_factor=UNIT_FACTOR, use_cache=True, cache_dir=str(cache_dir),
+               print_summary=False, writer=False)
+    return cfg
+
+
+def _write_at2(path, values):
+    header = "PEER NGA\nTEST RECORD\nACCELERATION TIME SERIES IN UNITS OF G\n"
+    path.write_text(header + f"NPTS= {len(values)}, DT= .0100 SEC\n"
+                    + "\n".join(f"{v:.6e}" for v in values) + "\n")
+
+
+@pytest.fixture
+def record(tmp_path):
+    rng = np.random.default_rng(0)
+    values = {name: rng.standard_normal(50) for name in ('REC_Z', 'REC_X', 'REC_Y')}
+    folder = tmp_path / 'record'
+    folder.mkdir()
+    for name, v in values.items():
+        _write_at2(folder / f'{name}.AT2', v)
+    return str(folder), values
+
+
+@pytest.mark.parametrize('run', ['computed', 'cached'])
+def test_signals_raw_maps_files_to_component_rows(record, tmp_path, capsys, run):
+    folder, values = record
+    cfg = _config(tmp_path / 'cache')
+    eq = EarthquakeSignal(folder, cfg)
+    eq.load_and_process()
+    if run == 'cached':
+        capsys.readouterr()
+        eq = EarthquakeSignal(folder, cfg)
+        eq.load_and_process()
+        assert 'load cached results' in capsys.readouterr().out
+
+    expected = {'H1': 'REC_X', 'H2': 'REC_Y', 'V': 'REC_Z'}
+    assert list(eq.signals_raw) == [f'{expected[c]}.AT2' for c in ('H1', 'H2', 'V')]
+    for comp, name in expected.items():
+        raw = eq.signals_raw[f'{name}.AT2']
+        assert np.shares_memory(raw, eq.signals_stack)
+        assert np.shares_memory(eq.signals[comp], eq.signals_stack)
+        np.testing.assert_array_equal(raw, eq.signals[comp])
+        np.testing.assert_allclose(raw, values[name].astype(np.float32) / UNIT_FACTOR, rtol=1e-6)
+
+
+def test_ensure_fourier_computes_once_without_touching_results(record, tmp_path, capsys):
+    folder, _ = record
+    eq = EarthquakeSignal(folder, _config(tmp_path / 'cache'))
+    eq.load_and_process()
+    capsys.readouterr()
+
+    fourier = eq.ensure_fourier()
+
+    assert set(fourier) == {'H1', 'H2', 'V'}
+    assert eq.ensure_fourier() is fourier
+    assert eq.fourier == {}
+    assert capsys.readouterr().out == ''
+
+
+def test_fourier_plot_reuses_extra_peaks(record, tmp_path, monkeypatch):
+    import matplotlib
+    matplotlib.use('Agg')
+    from EarthquakeSignal.tools import fourier_plotter
+
+    folder, _ = record
+    eq = EarthquakeSignal(folder, _config(tmp_path / 'cache'))
+    eq.name = 'REC'
+    eq.load_and_process()
+    monkeypatch.setattr(fourier_plotter, 'OUTPUTS_DIR', str(tmp_path / 'outputs'))
+    calls = []
+    dominant_peaks = fourier_plotter.FourierAnalyzer.dominant_peaks
+    monkeypatch.setattr(fourier_plotter.FourierAnalyzer, 'dominant_peaks',
+                        staticmethod(lambda *args: calls.append(args) or dominant_peaks(*args)))
+
+    for _ in range(2):
+        eq.fourier_plotter.plot_spectrum(num_frequencies=50, save_svg=True, show=False)
+
+    assert len([args for args in calls if args[2] == 50]) == 3
+
+
+def test_ensure_newmark_spectra_computes_once_without_touching_results(record, tmp_path, capsys):
+    folder, _ = record
+    cfg = _config(tmp_path / 'cache')
+    cfg['apply_baseline_correction'] = True
+    eq = EarthquakeSignal(folder, cfg)
+    eq.load_and_process()
+    capsys.readouterr()
+
+    spectra = eq.ensure_newmark_spectra()
+
+    assert set(spectra) == {'H1', 'H2', 'V'}
+    assert eq.ensure_newmark_spectra() is spectra
+    assert eq.newmark_spectra == {}
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,80 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from EarthquakeSignal.core.fourier_analyzer import FourierAnalyzer
+
+
+class _DeviceArray(np.ndarray):
+    """Stand-in for a cupy.ndarray: results stay 'on the device' until asnumpy."""
+
+
+@pytest.fixture
+def fake_cupy(monkeypatch):
+    calls = []
+
+    def asarray(a):
+        calls.append('asarray')
+        return np.asarray(a).view(_DeviceArray)
+
+    def rfft(a, n=None, axis=-1):
+        assert isinstance(a, _DeviceArray)
+        calls.append('rfft')
+        return np.fft.rfft(np.asarray(a), n=n, axis=axis).view(_DeviceArray)
+
+    def asnumpy(a):
+        assert isinstance(a, _DeviceArray)
+        calls.append('asnumpy')
+        return np.array(a.view(np.ndarray))
+
+    module = types.ModuleType('cupy')
+    module.asarray, module.asnumpy = asarray, asnumpy
+    module.fft = types.SimpleNamespace(rfft=rfft)
+    monkeypatch.setitem(sys.modules, 'cupy', module)
+    return calls
+
+
+@pytest.fixture
+def signals():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((3, 500))
+
+
+@pytest.mark.parametrize('backend, env', [('gpu', None), (None, '1')])
+def test_gpu_backend_dispatches_to_cupy(fake_cupy, signals, monkeypatch, backend, env):
+    if env is None:
+        monkeypatch.delenv('EQS_GPU', raising=False)
+    else:
+        monkeypatch.setenv('EQS_GPU', env)
+    freqs_cpu, Pyy_cpu = FourierAnalyzer.spectrum_batch(signals, 0.01, backend='cpu')
+    assert fake_cupy == []
+
+    freqs, Pyy = FourierAnalyzer.spectrum_batch(signals, 0.01, backend=backend)
+
+    assert fake_cupy == ['asarray', 'rfft', 'asnumpy']
+    assert type(Pyy) is np.ndarray
+    np.testing.assert_array_equal(freqs, freqs_cpu)
+    np.testing.assert_allclose(Pyy, Pyy_cpu, rtol=1e-10, atol=1e-12)
+
+
+def test_default_backend_reads_flag_at_call_time(fake_cupy, signals, monkeypatch):
+    monkeypatch.delenv('EQS_GPU', raising=False)
+    FourierAnalyzer.compute_batch(signals, 0.01)
+    assert fake_cupy == []
+
+    monkeypatch.setenv('EQS_GPU', '1')
+    FourierAnalyzer.compute_batch(signals, 0.01)
+    assert fake_cupy == ['asarray', 'rfft', 'asnumpy']
+
+
+def test_gpu_backend_without_cupy(signals, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'cupy', None)  # import cupy -> ImportError
+    monkeypatch.setenv('EQS_GPU', '1')
+
+    FourierAnalyzer.spectrum_batch(signals, 0.01)  # flag only: falls back to scipy.fft
+    with pytest.raises(ImportError):
+        FourierAnalyzer.spectrum_batch(signals, 0.01, backend='gpu')
+    with pytest.raises(ValueError):
+        FourierAnalyzer.spectrum_batch(signals, 0.01, backend='cuda')
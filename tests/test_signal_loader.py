@@ -0,0 +1,55 @@
+import io
+import warnings
+
+import numpy as np
+
+from EarthquakeSignal.core.signal_loader import SignalLoader
+
+AT2_HEADER = "PEER NGA\nTEST RECORD\nACCELERATION TIME SERIES IN UNITS OF G\nNPTS=    6, DT= .0050 SEC\n"
+
+
+def _read(body):
+    loader = SignalLoader('.', '.AT2', files=[('A.AT2', io.StringIO(AT2_HEADER + body))])
+    return loader.read()
+
+
+def test_parse_values_well_formed():
+    dt, signals = _read("  .1 -.2  3.0E-01\n 4.0E-01 -5 6\n")
+    assert dt == 0.005
+    np.testing.assert_array_equal(signals['A.AT2'],
+                                  np.array([.1, -.2, .3, .4, -5, 6], dtype=np.float32))
+
+
+def test_parse_values_malformed_line_filled_with_zeros():
+    _, signals = _read("1 2 3\nbad line here\n4 5 6\n")
+    np.testing.assert_array_equal(signals['A.AT2'],
+                                  np.array([1, 2, 3, 0, 0, 0, 4, 5, 6], dtype=np.float32))
+
+
+def test_parse_values_malformed_last_line_not_truncated():
+    _, signals = _read("1 2 3\n4 5 6\nbad line here\n")
+    np.testing.assert_array_equal(signals['A.AT2'],
+                                  np.array([1, 2, 3, 4, 5, 6, 0, 0, 0], dtype=np.float32))
+
+
+def test_parse_values_truncating_fromstring_falls_back(monkeypatch):
+    # NumPy 1.x: fromstring avisa y devuelve lo leído hasta el token inválido
+    real_fromstring = np.fromstring
+
+    def truncating_fromstring(string, dtype=float, sep=''):
+        try:
+            return real_fromstring(string, dtype=dtype, sep=sep)
+        except ValueError:
+            warnings.warn("string or file could not be read to its end", DeprecationWarning)
+            valid = []
+            for token in string.split():
+                try:
+                    valid.append(float(token))
+                except ValueError:
+                    break
+            return np.array(valid, dtype=dtype)
+
+    monkeypatch.setattr(np, 'fromstring', truncating_fromstring)
+    _, signals = _read("1 2 3\nbad line here\n4 5 6\n")
+    np.testing.assert_array_equal(signals['A.AT2'],
+                                  np.array([1, 2, 3, 0, 0, 0, 4, 5, 6], dtype=np.float32))